@@ -0,0 +1,98 @@
+// Copyright (c) 2025 Junior Sundar
+//
+// SPDX-License-Identifier: BSD-3-Clause
+
+use pyo3::{exceptions::PyValueError, prelude::*};
+
+use oxmpl::base::state::RealVectorState as OxmplRealVectorState;
+
+use super::real_vector_state::PyRealVectorState;
+
+/// A native validity checker for `RealVectorState` defined by an axis-aligned box.
+///
+/// Passing this to a planner's `setup` instead of a Python function keeps every validity check
+/// inside Rust, so the planner never has to call back into the interpreter.
+///
+/// Args:
+///     min (List[float]): The lower corner of the box.
+///     max (List[float]): The upper corner of the box.
+///     invert (bool): If `False`, states inside the box are valid. If `True`, the box is an
+///         obstacle and only states outside it are valid.
+///
+/// Raises:
+///     ValueError: If `min` and `max` differ in length or `min` exceeds `max` in any dimension.
+#[pyclass(name = "AABBValidityChecker", unsendable)]
+#[derive(Clone)]
+pub struct PyAABBValidityChecker {
+    min: Vec<f64>,
+    max: Vec<f64>,
+    invert: bool,
+}
+
+impl PyAABBValidityChecker {
+    /// The number of dimensions the box is defined over.
+    pub fn dimension(&self) -> usize {
+        self.min.len()
+    }
+
+    /// Returns `true` if `state` is valid with respect to this box.
+    pub fn is_valid(&self, state: &OxmplRealVectorState) -> bool {
+        let inside = state
+            .values
+            .iter()
+            .zip(self.min.iter().zip(self.max.iter()))
+            .all(|(v, (lo, hi))| v >= lo && v <= hi);
+        inside != self.invert
+    }
+}
+
+#[pymethods]
+impl PyAABBValidityChecker {
+    #[new]
+    #[pyo3(signature = (min, max, invert=false))]
+    fn new(min: Vec<f64>, max: Vec<f64>, invert: bool) -> PyResult<Self> {
+        if min.len() != max.len() {
+            return Err(PyValueError::new_err(format!(
+                "min has {} dimensions but max has {}.",
+                min.len(),
+                max.len()
+            )));
+        }
+        if let Some((lo, hi)) = min.iter().zip(max.iter()).find(|(lo, hi)| lo > hi) {
+            return Err(PyValueError::new_err(format!(
+                "Lower corner {lo} is greater than upper corner {hi}."
+            )));
+        }
+        Ok(Self { min, max, invert })
+    }
+
+    /// list[float]: The lower corner of the box.
+    #[getter]
+    fn get_min(&self) -> Vec<f64> {
+        self.min.clone()
+    }
+
+    /// list[float]: The upper corner of the box.
+    #[getter]
+    fn get_max(&self) -> Vec<f64> {
+        self.max.clone()
+    }
+
+    /// bool: Whether the box is treated as an obstacle.
+    #[getter]
+    fn get_invert(&self) -> bool {
+        self.invert
+    }
+
+    /// Checks a single state, so the checker can also be used like a Python validity function.
+    fn __call__(&self, state: &PyRealVectorState) -> bool {
+        self.is_valid(&state.0)
+    }
+
+    fn __repr__(&self) -> String {
+        format!(
+            "<AABBValidityChecker min={:?}, max={:?}, invert={}>",
+            self.min, self.max, self.invert
+        )
+    }
+}
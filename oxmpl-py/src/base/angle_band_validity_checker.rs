@@ -0,0 +1,81 @@
+// Copyright (c) 2025 Junior Sundar
+//
+// SPDX-License-Identifier: BSD-3-Clause
+
+use pyo3::{exceptions::PyValueError, prelude::*};
+
+use oxmpl::base::state::SO2State as OxmplSO2State;
+
+use super::so2_state::PySO2State;
+
+/// A native validity checker for `SO2State` defined by a closed band of angles.
+///
+/// The angle of the state is compared in its canonical `[-PI, PI)` range.
+///
+/// Args:
+///     lo (float): The lower end of the band, in radians.
+///     hi (float): The upper end of the band, in radians.
+///     invert (bool): If `False`, angles inside the band are valid. If `True`, the band is a
+///         forbidden zone and only angles outside it are valid.
+///
+/// Raises:
+///     ValueError: If `lo` is greater than `hi`.
+#[pyclass(name = "AngleBandValidityChecker", unsendable)]
+#[derive(Clone)]
+pub struct PyAngleBandValidityChecker {
+    lo: f64,
+    hi: f64,
+    invert: bool,
+}
+
+impl PyAngleBandValidityChecker {
+    /// Returns `true` if `state` is valid with respect to this band.
+    pub fn is_valid(&self, state: &OxmplSO2State) -> bool {
+        let inside = state.value >= self.lo && state.value <= self.hi;
+        inside != self.invert
+    }
+}
+
+#[pymethods]
+impl PyAngleBandValidityChecker {
+    #[new]
+    #[pyo3(signature = (lo, hi, invert=false))]
+    fn new(lo: f64, hi: f64, invert: bool) -> PyResult<Self> {
+        if lo > hi {
+            return Err(PyValueError::new_err(format!(
+                "Lower angle {lo} is greater than upper angle {hi}."
+            )));
+        }
+        Ok(Self { lo, hi, invert })
+    }
+
+    /// float: The lower end of the band.
+    #[getter]
+    fn get_lo(&self) -> f64 {
+        self.lo
+    }
+
+    /// float: The upper end of the band.
+    #[getter]
+    fn get_hi(&self) -> f64 {
+        self.hi
+    }
+
+    /// bool: Whether the band is treated as a forbidden zone.
+    #[getter]
+    fn get_invert(&self) -> bool {
+        self.invert
+    }
+
+    /// Checks a single state, so the checker can also be used like a Python validity function.
+    fn __call__(&self, state: &PySO2State) -> bool {
+        self.is_valid(&state.0)
+    }
+
+    fn __repr__(&self) -> String {
+        format!(
+            "<AngleBandValidityChecker lo={:?}, hi={:?}, invert={}>",
+            self.lo, self.hi, self.invert
+        )
+    }
+}
@@ -0,0 +1,103 @@
+// Copyright (c) 2025 Junior Sundar
+//
+// SPDX-License-Identifier: BSD-3-Clause
+
+use pyo3::{exceptions::PyValueError, prelude::*};
+use rand::{Rng, RngCore};
+use std::sync::Arc;
+
+use oxmpl::base::{
+    space::{SO2StateSpace as OxmplSO2StateSpace, StateSpace as _},
+    state::SO2State as OxmplSO2State,
+};
+
+use super::{goal::NativeGoal, so2_state::PySO2State, so2_state_space::PySO2StateSpace};
+
+/// A native goal region for `SO2State` covering every angle within `radius` of `target`.
+///
+/// Passing this to `ProblemDefinition.from_so2` instead of a Python goal object keeps goal checks
+/// and goal sampling inside Rust. Together with `AngleBandValidityChecker`, an SO(2) planner can
+/// then run without calling back into the interpreter at all.
+///
+/// Args:
+///     space (SO2StateSpace): The space whose metric defines the region.
+///     target (SO2State): The angle at the center of the region.
+///     radius (float): The angular radius of the region, in radians.
+///
+/// Raises:
+///     ValueError: If `radius` is negative.
+#[pyclass(name = "AngleGoalRegion", unsendable)]
+#[derive(Clone)]
+pub struct PyAngleGoalRegion {
+    space: OxmplSO2StateSpace,
+    target: OxmplSO2State,
+    radius: f64,
+}
+
+impl NativeGoal<OxmplSO2State> for PyAngleGoalRegion {
+    fn is_satisfied(&self, state: &OxmplSO2State) -> bool {
+        self.space.distance(state, &self.target) <= self.radius
+    }
+
+    fn distance_goal(&self, state: &OxmplSO2State) -> f64 {
+        (self.space.distance(state, &self.target) - self.radius).max(0.0)
+    }
+
+    fn sample_goal(&self, rng: &mut dyn RngCore) -> OxmplSO2State {
+        OxmplSO2State::new(self.target.value + rng.random_range(-self.radius..=self.radius))
+    }
+}
+
+#[pymethods]
+impl PyAngleGoalRegion {
+    #[new]
+    fn new(space: &PySO2StateSpace, target: &PySO2State, radius: f64) -> PyResult<Self> {
+        if radius < 0.0 {
+            return Err(PyValueError::new_err(format!(
+                "Goal radius cannot be negative. Provided: {radius}."
+            )));
+        }
+        Ok(Self {
+            space: space.0.lock().unwrap().clone(),
+            target: (*target.0).clone(),
+            radius,
+        })
+    }
+
+    /// SO2State: The angle at the center of the region.
+    #[getter]
+    fn get_target(&self) -> PySO2State {
+        PySO2State(Arc::new(self.target.clone()))
+    }
+
+    /// float: The angular radius of the region.
+    #[getter]
+    fn get_radius(&self) -> f64 {
+        self.radius
+    }
+
+    /// Returns `True` if `state` lies inside the region.
+    #[pyo3(name = "is_satisfied")]
+    fn py_is_satisfied(&self, state: &PySO2State) -> bool {
+        NativeGoal::is_satisfied(self, &state.0)
+    }
+
+    /// Returns the angular distance from `state` to the edge of the region, or `0.0` inside it.
+    #[pyo3(name = "distance_goal")]
+    fn py_distance_goal(&self, state: &PySO2State) -> f64 {
+        NativeGoal::distance_goal(self, &state.0)
+    }
+
+    /// Draws an angle uniformly from the region.
+    #[pyo3(name = "sample_goal")]
+    fn py_sample_goal(&self) -> PySO2State {
+        PySO2State(Arc::new(NativeGoal::sample_goal(self, &mut rand::rng())))
+    }
+
+    fn __repr__(&self) -> String {
+        format!(
+            "<AngleGoalRegion target={:?}, radius={:?}>",
+            self.target.value, self.radius
+        )
+    }
+}
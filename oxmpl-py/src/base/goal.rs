@@ -2,9 +2,12 @@
 //
 // SPDX-License-Identifier: BSD-3-Clause
 
-use pyo3::prelude::*;
-use rand::Rng;
-use std::marker::PhantomData;
+use pyo3::{exceptions::PyValueError, prelude::*};
+use rand::{Rng, RngCore};
+use std::{
+    collections::VecDeque,
+    sync::{Arc, Mutex, OnceLock},
+};
 
 use oxmpl::base::{
     error::StateSamplingError,
@@ -14,23 +17,170 @@ use oxmpl::base::{
 
 use super::py_state_convert::PyStateConvert;
 
+/// Number of goal samples requested per call when the goal defines `sample_goal_batch`.
+const GOAL_SAMPLE_BATCH_SIZE: usize = 64;
+
+/// A goal region implemented in Rust, such as `AngleGoalRegion`.
+///
+/// `GoalSampleableRegion::sample_goal` is generic over the RNG, so native goals sample through
+/// `dyn RngCore` instead to stay usable behind a trait object.
+pub trait NativeGoal<State> {
+    fn is_satisfied(&self, state: &State) -> bool;
+    fn distance_goal(&self, state: &State) -> f64;
+    fn sample_goal(&self, rng: &mut dyn RngCore) -> State;
+}
+
+/// Wraps a Python goal object.
+///
+/// The object must provide `is_satisfied(state)`, `distance_goal(state)` and `sample_goal()`.
+/// It may also provide `sample_goal_batch(n)`, returning `n` goal samples either as states or as
+/// rows of state components (e.g. a NumPy array of shape `(n, dim)`). If present, it is used to
+/// refill an internal buffer so that most calls to `sample_goal` never enter Python.
+///
+/// If the object is a native goal, every call is forwarded to it without acquiring the GIL.
 pub struct PyGoal<State> {
     pub instance: PyObject,
-    pub _phantom: PhantomData<State>,
+    native: Option<Arc<dyn NativeGoal<State>>>,
+    state_width: Option<usize>,
+    has_batch_sampler: OnceLock<bool>,
+    sample_buffer: Mutex<VecDeque<State>>,
+}
+
+impl<State> PyGoal<State> {
+    pub fn new(instance: PyObject) -> Self {
+        Self {
+            instance,
+            native: None,
+            state_width: None,
+            has_batch_sampler: OnceLock::new(),
+            sample_buffer: Mutex::new(VecDeque::new()),
+        }
+    }
+
+    /// Wraps `instance`, answering every goal query through `native` instead of Python.
+    pub fn with_native(instance: PyObject, native: Arc<dyn NativeGoal<State>>) -> Self {
+        Self {
+            native: Some(native),
+            ..Self::new(instance)
+        }
+    }
+
+    /// Wraps `instance`, rejecting goal samples that do not have exactly `width` components.
+    ///
+    /// Used for spaces such as `RealVectorStateSpace`, where `from_components` accepts any number
+    /// of components but the space only works with states of its own dimension.
+    pub fn with_state_width(instance: PyObject, width: usize) -> Self {
+        Self {
+            state_width: Some(width),
+            ..Self::new(instance)
+        }
+    }
 }
 
 impl<State> Clone for PyGoal<State> {
     fn clone(&self) -> Self {
         Python::with_gil(|py| Self {
-            instance: self.instance.clone_ref(py),
-            _phantom: PhantomData,
+            native: self.native.clone(),
+            state_width: self.state_width,
+            ..Self::new(self.instance.clone_ref(py))
         })
     }
 }
 
+impl<State: PyStateConvert> PyGoal<State> {
+    /// Calls `sample_goal_batch` once and converts every returned row into a state.
+    ///
+    /// Rows are read as state components first, since that is the NumPy case. The first row
+    /// decides the layout of the whole batch, so a failed conversion is attempted at most once.
+    ///
+    /// # Errors
+    /// Returns a `ValueError` if a row does not describe a valid state, including rows whose
+    /// width differs from the one set with `with_state_width`.
+    fn sample_goal_batch(&self, py: Python<'_>) -> PyResult<VecDeque<State>> {
+        let batch =
+            self.instance
+                .call_method1(py, "sample_goal_batch", (GOAL_SAMPLE_BATCH_SIZE,))?;
+        let mut states = VecDeque::with_capacity(GOAL_SAMPLE_BATCH_SIZE);
+        // Decided by the first row, so later rows never try the other conversion.
+        let mut layout: Option<BatchLayout> = None;
+        for row in batch.bind(py).try_iter()? {
+            let row = row?;
+            let components = match layout {
+                Some(BatchLayout::States) => {
+                    states.push_back(self.checked_wrapper(row.extract()?)?);
+                    continue;
+                }
+                Some(BatchLayout::Rows) => extract_components(&row)?,
+                None => match extract_components(&row) {
+                    Ok(components) => components,
+                    Err(err) => {
+                        let wrapper = row.extract::<State::Wrapper>().map_err(|_| err)?;
+                        layout = Some(BatchLayout::States);
+                        states.push_back(self.checked_wrapper(wrapper)?);
+                        continue;
+                    }
+                },
+            };
+
+            let len = components.len();
+            if let Some(width) = self.state_width.filter(|&width| width != len) {
+                return Err(PyValueError::new_err(format!(
+                    "sample_goal_batch returned a row with {len} components, but states in this \
+                     space have {width}."
+                )));
+            }
+            layout = Some(BatchLayout::Rows);
+            let state = State::from_components(components).ok_or_else(|| {
+                PyValueError::new_err(format!(
+                    "sample_goal_batch returned a row with {len} components, which is not a \
+                     valid state."
+                ))
+            })?;
+            states.push_back(state);
+        }
+        Ok(states)
+    }
+
+    /// Converts a state wrapper returned by the goal, checking it against `state_width`.
+    fn checked_wrapper(&self, wrapper: State::Wrapper) -> PyResult<State> {
+        let state = State::from_py_wrapper(wrapper);
+        if let Some(width) = self.state_width {
+            let mut components = Vec::with_capacity(width);
+            state.extend_components(&mut components);
+            if components.len() != width {
+                return Err(PyValueError::new_err(format!(
+                    "Goal returned a state with {} components, but states in this space have \
+                     {width}.",
+                    components.len()
+                )));
+            }
+        }
+        Ok(state)
+    }
+}
+
+/// How the rows returned by `sample_goal_batch` are converted into states.
+#[derive(Clone, Copy)]
+enum BatchLayout {
+    /// Every row is a state wrapper, e.g. a `RealVectorState`.
+    States,
+    /// Every row holds the components of a state, e.g. a row of a NumPy array.
+    Rows,
+}
+
+/// Reads one row of `sample_goal_batch` as state components. A bare number is treated as a
+/// one-component row, so 1-D arrays work for `SO2State`.
+fn extract_components(row: &Bound<'_, PyAny>) -> PyResult<Vec<f64>> {
+    row.extract::<Vec<f64>>()
+        .or_else(|_| row.extract::<f64>().map(|value| vec![value]))
+}
+
 // Implement the Goal traits for ANY state type that satisfies our conversion trait.
 impl<State: PyStateConvert + state::State> Goal<State> for PyGoal<State> {
     fn is_satisfied(&self, state: &State) -> bool {
+        if let Some(native) = &self.native {
+            return native.is_satisfied(state);
+        }
         Python::with_gil(|py| {
             let py_state = state.to_py_wrapper();
             self.instance
@@ -43,6 +193,9 @@ impl<State: PyStateConvert + state::State> Goal<State> for PyGoal<State> {
 
 impl<State: PyStateConvert + state::State> GoalRegion<State> for PyGoal<State> {
     fn distance_goal(&self, state: &State) -> f64 {
+        if let Some(native) = &self.native {
+            return native.distance_goal(state);
+        }
         Python::with_gil(|py| {
             let py_state = state.to_py_wrapper();
             self.instance
@@ -54,16 +207,41 @@ impl<State: PyStateConvert + state::State> GoalRegion<State> for PyGoal<State> {
 }
 
 impl<State: PyStateConvert + state::State> GoalSampleableRegion<State> for PyGoal<State> {
-    fn sample_goal(&self, _rng: &mut impl Rng) -> Result<State, StateSamplingError> {
+    fn sample_goal(&self, rng: &mut impl Rng) -> Result<State, StateSamplingError> {
+        if let Some(native) = &self.native {
+            return Ok(native.sample_goal(rng));
+        }
+        if let Some(state) = self.sample_buffer.lock().unwrap().pop_front() {
+            return Ok(state);
+        }
+
         Python::with_gil(|py| {
-            self.instance
-                .call_method0(py, "sample_goal")
-                .and_then(|res| res.extract::<State::Wrapper>(py))
-                .map(State::from_py_wrapper)
-                .map_err(|e| {
-                    e.print(py);
-                    StateSamplingError::GoalRegionUnsatisfiable
+            let has_batch_sampler = *self.has_batch_sampler.get_or_init(|| {
+                self.instance
+                    .bind(py)
+                    .hasattr("sample_goal_batch")
+                    .unwrap_or(false)
+            });
+
+            let sampled = if has_batch_sampler {
+                self.sample_goal_batch(py).and_then(|mut states| {
+                    let first = states.pop_front().ok_or_else(|| {
+                        PyValueError::new_err("sample_goal_batch returned no samples.")
+                    })?;
+                    self.sample_buffer.lock().unwrap().extend(states);
+                    Ok(first)
                 })
+            } else {
+                self.instance
+                    .call_method0(py, "sample_goal")
+                    .and_then(|res| res.extract::<State::Wrapper>(py))
+                    .and_then(|wrapper| self.checked_wrapper(wrapper))
+            };
+
+            sampled.map_err(|e| {
+                e.print(py);
+                StateSamplingError::GoalRegionUnsatisfiable
+            })
         })
     }
 }
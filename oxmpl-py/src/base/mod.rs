@@ -4,6 +4,9 @@
 
 use pyo3::prelude::*;
 
+mod aabb_validity_checker;
+mod angle_band_validity_checker;
+mod angle_goal_region;
 mod goal;
 mod path;
 mod problem_definition;
@@ -12,10 +15,15 @@ mod real_vector_state;
 mod real_vector_state_space;
 mod so2_state;
 mod so2_state_space;
+mod so3_cone_validity_checker;
 mod so3_state;
 mod so3_state_space;
 mod state_validity_checker;
+mod vectorized_validity_checker;
 
+pub use aabb_validity_checker::PyAABBValidityChecker;
+pub use angle_band_validity_checker::PyAngleBandValidityChecker;
+pub use angle_goal_region::PyAngleGoalRegion;
 pub use goal::PyGoal;
 pub use path::PyPath;
 pub use problem_definition::ProblemDefinitionVariant;
@@ -24,9 +32,11 @@ pub use real_vector_state::PyRealVectorState;
 pub use real_vector_state_space::PyRealVectorStateSpace;
 pub use so2_state::PySO2State;
 pub use so2_state_space::PySO2StateSpace;
+pub use so3_cone_validity_checker::PySO3ConeValidityChecker;
 pub use so3_state::PySO3State;
 pub use so3_state_space::PySO3StateSpace;
 pub use state_validity_checker::PyStateValidityChecker;
+pub use vectorized_validity_checker::PyVectorizedValidityChecker;
 
 pub fn create_module(_py: Python<'_>) -> PyResult<Bound<'_, PyModule>> {
     let base_module = PyModule::new(_py, "base")?;
@@ -38,5 +48,10 @@ pub fn create_module(_py: Python<'_>) -> PyResult<Bound<'_, PyModule>> {
     base_module.add_class::<PySO3StateSpace>()?;
     base_module.add_class::<PyPath>()?;
     base_module.add_class::<PyProblemDefinition>()?;
+    base_module.add_class::<PyAABBValidityChecker>()?;
+    base_module.add_class::<PyAngleBandValidityChecker>()?;
+    base_module.add_class::<PyAngleGoalRegion>()?;
+    base_module.add_class::<PySO3ConeValidityChecker>()?;
+    base_module.add_class::<PyVectorizedValidityChecker>()?;
     Ok(base_module)
 }
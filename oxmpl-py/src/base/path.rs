@@ -5,6 +5,7 @@
 use pyo3::{prelude::*, types::PyList};
 use std::sync::Arc;
 
+use super::py_state_convert::states_to_ndarray;
 use super::real_vector_state::PyRealVectorState;
 use super::so2_state::PySO2State;
 use super::so3_state::PySO3State;
@@ -79,6 +80,25 @@ impl PyPath {
         Ok(py_list.into())
     }
 
+    /// Returns the states of the path as a NumPy array with one state per row.
+    ///
+    /// Rows hold the components of each state: its values for `RealVectorState`, `[value]` for
+    /// `SO2State` and `[x, y, z, w]` for `SO3State`. The array is a copy, built in one pass without
+    /// creating a Python object per state.
+    ///
+    /// Returns:
+    ///     numpy.ndarray: A `float64` array of shape `(len(path), k)`.
+    ///
+    /// Raises:
+    ///     ImportError: If NumPy is not installed.
+    fn as_ndarray<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyAny>> {
+        match &self.0 {
+            PathVariant::RealVector(path) => states_to_ndarray(py, &path.0),
+            PathVariant::SO2(path) => states_to_ndarray(py, &path.0),
+            PathVariant::SO3(path) => states_to_ndarray(py, &path.0),
+        }
+    }
+
     /// The number of states in the path.
     fn __len__(&self) -> usize {
         match &self.0 {
@@ -4,7 +4,7 @@
 
 use pyo3::prelude::*;
 use pyo3::types::PyType;
-use std::{marker::PhantomData, sync::Arc};
+use std::sync::Arc;
 
 use oxmpl::base::{
     problem_definition::ProblemDefinition,
@@ -19,7 +19,7 @@ use oxmpl::base::{
 };
 
 use super::{
-    goal::PyGoal, real_vector_state::PyRealVectorState,
+    angle_goal_region::PyAngleGoalRegion, goal::PyGoal, real_vector_state::PyRealVectorState,
     real_vector_state_space::PyRealVectorStateSpace, so2_state::PySO2State,
     so2_state_space::PySO2StateSpace, so3_state::PySO3State, so3_state_space::PySO3StateSpace,
 };
@@ -55,15 +55,14 @@ impl PyProblemDefinition {
         start_state: &PyRealVectorState,
         goal: PyObject,
     ) -> Self {
-        // Instantiate the correct generic version of PyGoal
-        let goal_wrapper = PyGoal::<OxmplRealVectorState> {
-            instance: goal,
-            _phantom: PhantomData,
-        };
-
         // Create a snapshot of the space's configuration
         let cloned_inner_space = space.0.lock().unwrap().clone();
 
+        // Instantiate the correct generic version of PyGoal, rejecting goal samples whose
+        // dimension differs from the space's
+        let goal_wrapper =
+            PyGoal::<OxmplRealVectorState>::with_state_width(goal, cloned_inner_space.dimension);
+
         let pd = ProblemDefinition {
             space: Arc::new(cloned_inner_space),
             start_states: vec![(*start_state.0).clone()],
@@ -75,18 +74,22 @@ impl PyProblemDefinition {
     }
 
     /// Creates a ProblemDefinition for an SO2StateSpace.
+    ///
+    /// `goal` may be a native `AngleGoalRegion`, in which case the planner never calls back into
+    /// Python to check or sample the goal.
     #[classmethod]
     #[pyo3(signature = (space, start_state, goal))]
     fn from_so2(
-        _cls: &Bound<'_, PyType>,
+        cls: &Bound<'_, PyType>,
         space: &PySO2StateSpace,
         start_state: &PySO2State,
         goal: PyObject,
     ) -> Self {
         // Instantiate the correct generic version of PyGoal
-        let goal_wrapper = PyGoal::<OxmplSO2State> {
-            instance: goal,
-            _phantom: PhantomData,
+        let native = goal.extract::<PyAngleGoalRegion>(cls.py()).ok();
+        let goal_wrapper = match native {
+            Some(region) => PyGoal::<OxmplSO2State>::with_native(goal, Arc::new(region)),
+            None => PyGoal::<OxmplSO2State>::new(goal),
         };
 
         // Create a snapshot of the space's configuration
@@ -112,10 +115,7 @@ impl PyProblemDefinition {
         goal: PyObject,
     ) -> Self {
         // Instantiate the correct generic version of PyGoal
-        let goal_wrapper = PyGoal::<OxmplSO3State> {
-            instance: goal,
-            _phantom: PhantomData,
-        };
+        let goal_wrapper = PyGoal::<OxmplSO3State>::new(goal);
 
         // Create a snapshot of the space's configuration
         let cloned_inner_space = space.0.lock().unwrap().clone();
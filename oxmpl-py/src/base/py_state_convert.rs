@@ -8,7 +8,7 @@ use crate::base::{
 use oxmpl::base::state::{
     RealVectorState as OxmplRealVectorState, SO2State as OxmplSO2State, SO3State as OxmplSO3State,
 };
-use pyo3::prelude::*;
+use pyo3::{prelude::*, types::PyByteArray};
 use std::sync::Arc;
 
 /// A trait to handle conversions between a core Rust state and its PyO3 wrapper.
@@ -18,6 +18,35 @@ pub trait PyStateConvert: Clone + Send + Sync + 'static {
     fn to_py_wrapper(&self) -> Self::Wrapper;
 
     fn from_py_wrapper(wrapper: Self::Wrapper) -> Self;
+
+    /// Builds a state from its raw components, e.g. one row of a NumPy array.
+    ///
+    /// Takes the vector by value so that states backed by a `Vec` can reuse its allocation.
+    /// Returns `None` if the number of components does not describe a valid state.
+    fn from_components(components: Vec<f64>) -> Option<Self>;
+
+    /// Appends the raw components of the state to `out`, in the order `from_components` expects.
+    fn extend_components(&self, out: &mut Vec<f64>);
+}
+
+/// Packs `states` row-wise into a new, writable `float64` NumPy array of shape `(n, k)`, where `k`
+/// is the number of components per state.
+///
+/// NumPy is imported when this is called, so it is only needed by the features that use it.
+pub fn states_to_ndarray<'py, S: PyStateConvert>(
+    py: Python<'py>,
+    states: &[S],
+) -> PyResult<Bound<'py, PyAny>> {
+    let mut components = Vec::new();
+    for state in states {
+        state.extend_components(&mut components);
+    }
+    let width = components.len().checked_div(states.len()).unwrap_or(0);
+    let bytes: Vec<u8> = components.iter().flat_map(|v| v.to_ne_bytes()).collect();
+
+    py.import("numpy")?
+        .call_method1("frombuffer", (PyByteArray::new(py, &bytes), "float64"))?
+        .call_method1("reshape", (states.len(), width))
 }
 
 impl PyStateConvert for OxmplRealVectorState {
@@ -30,6 +59,14 @@ impl PyStateConvert for OxmplRealVectorState {
     fn from_py_wrapper(wrapper: Self::Wrapper) -> Self {
         (*wrapper.0).clone()
     }
+
+    fn from_components(components: Vec<f64>) -> Option<Self> {
+        Some(OxmplRealVectorState::new(components))
+    }
+
+    fn extend_components(&self, out: &mut Vec<f64>) {
+        out.extend_from_slice(&self.values);
+    }
 }
 
 impl PyStateConvert for OxmplSO2State {
@@ -42,6 +79,17 @@ impl PyStateConvert for OxmplSO2State {
     fn from_py_wrapper(wrapper: Self::Wrapper) -> Self {
         (*wrapper.0).clone()
     }
+
+    fn from_components(components: Vec<f64>) -> Option<Self> {
+        match components.as_slice() {
+            [value] => Some(OxmplSO2State::new(*value)),
+            _ => None,
+        }
+    }
+
+    fn extend_components(&self, out: &mut Vec<f64>) {
+        out.push(self.value);
+    }
 }
 
 impl PyStateConvert for OxmplSO3State {
@@ -54,4 +102,15 @@ impl PyStateConvert for OxmplSO3State {
     fn from_py_wrapper(wrapper: Self::Wrapper) -> Self {
         (*wrapper.0).clone()
     }
+
+    fn from_components(components: Vec<f64>) -> Option<Self> {
+        match components.as_slice() {
+            [x, y, z, w] => Some(OxmplSO3State::new(*x, *y, *z, *w)),
+            _ => None,
+        }
+    }
+
+    fn extend_components(&self, out: &mut Vec<f64>) {
+        out.extend_from_slice(&[self.x, self.y, self.z, self.w]);
+    }
 }
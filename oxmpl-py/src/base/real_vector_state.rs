@@ -27,6 +27,16 @@ impl PyRealVectorState {
         Self(Arc::new(state))
     }
 
+    /// Creates a 2D state from its coordinates without building an intermediate list.
+    ///
+    /// Args:
+    ///     x (float): The first component.
+    ///     y (float): The second component.
+    #[staticmethod]
+    fn from_xy(x: f64, y: f64) -> Self {
+        Self(Arc::new(OxmplRealVectorState::new(vec![x, y])))
+    }
+
     /// list[float]: The components of the state vector.
     #[getter]
     fn get_values(&self) -> Vec<f64> {
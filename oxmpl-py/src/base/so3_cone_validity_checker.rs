@@ -0,0 +1,91 @@
+// Copyright (c) 2025 Junior Sundar
+//
+// SPDX-License-Identifier: BSD-3-Clause
+
+use pyo3::{exceptions::PyValueError, prelude::*};
+use std::sync::Arc;
+
+use oxmpl::base::state::SO3State as OxmplSO3State;
+
+use super::so3_state::PySO3State;
+
+/// A native validity checker for `SO3State` defined by a cone of rotations around a center.
+///
+/// A rotation lies inside the cone when its `SO3StateSpace` distance to `center` is at most
+/// `radius`. Since that distance is `acos(|dot|)`, the check is done as `|dot| >= cos(radius)`.
+///
+/// Args:
+///     center (SO3State): The rotation at the center of the cone.
+///     radius (float): The angular radius of the cone, in radians.
+///     invert (bool): If `False`, rotations inside the cone are valid. If `True`, the cone is a
+///         forbidden zone and only rotations outside it are valid.
+///
+/// Raises:
+///     ValueError: If `radius` is negative.
+#[pyclass(name = "SO3ConeValidityChecker", unsendable)]
+#[derive(Clone)]
+pub struct PySO3ConeValidityChecker {
+    center: OxmplSO3State,
+    radius: f64,
+    cos_radius: f64,
+    invert: bool,
+}
+
+impl PySO3ConeValidityChecker {
+    /// Returns `true` if `state` is valid with respect to this cone.
+    pub fn is_valid(&self, state: &OxmplSO3State) -> bool {
+        let c = &self.center;
+        let abs_dot = (c.x * state.x + c.y * state.y + c.z * state.z + c.w * state.w).abs();
+        let inside = abs_dot >= self.cos_radius;
+        inside != self.invert
+    }
+}
+
+#[pymethods]
+impl PySO3ConeValidityChecker {
+    #[new]
+    #[pyo3(signature = (center, radius, invert=false))]
+    fn new(center: PySO3State, radius: f64, invert: bool) -> PyResult<Self> {
+        if radius < 0.0 {
+            return Err(PyValueError::new_err(format!(
+                "Cone radius cannot be negative. Provided: {radius}."
+            )));
+        }
+        Ok(Self {
+            center: (*center.0).clone(),
+            radius,
+            cos_radius: radius.cos(),
+            invert,
+        })
+    }
+
+    /// SO3State: The rotation at the center of the cone.
+    #[getter]
+    fn get_center(&self) -> PySO3State {
+        PySO3State(Arc::new(self.center.clone()))
+    }
+
+    /// float: The angular radius of the cone.
+    #[getter]
+    fn get_radius(&self) -> f64 {
+        self.radius
+    }
+
+    /// bool: Whether the cone is treated as a forbidden zone.
+    #[getter]
+    fn get_invert(&self) -> bool {
+        self.invert
+    }
+
+    /// Checks a single state, so the checker can also be used like a Python validity function.
+    fn __call__(&self, state: &PySO3State) -> bool {
+        self.is_valid(&state.0)
+    }
+
+    fn __repr__(&self) -> String {
+        format!(
+            "<SO3ConeValidityChecker radius={:?}, invert={}>",
+            self.radius, self.invert
+        )
+    }
+}
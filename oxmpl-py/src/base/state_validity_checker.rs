@@ -2,7 +2,10 @@
 //
 // SPDX-License-Identifier: BSD-3-Clause
 
-use pyo3::prelude::*;
+use pyo3::{
+    exceptions::{PyTypeError, PyValueError},
+    prelude::*,
+};
 use std::sync::Arc;
 
 use oxmpl::base::{
@@ -10,79 +13,209 @@ use oxmpl::base::{
     state::SO3State as OxmplSO3State, validity::StateValidityChecker,
 };
 
+use super::aabb_validity_checker::PyAABBValidityChecker;
+use super::angle_band_validity_checker::PyAngleBandValidityChecker;
+use super::problem_definition::ProblemDefinitionVariant;
+use super::py_state_convert::{states_to_ndarray, PyStateConvert};
 use super::real_vector_state::PyRealVectorState;
 use super::so2_state::PySO2State;
+use super::so3_cone_validity_checker::PySO3ConeValidityChecker;
 use super::so3_state::PySO3State;
+use super::vectorized_validity_checker::PyVectorizedValidityChecker;
 
-/// An internal Rust struct that implements the `StateValidityChecker` trait by calling a
-/// user-provided Python function.
-pub struct PyStateValidityChecker {
-    pub callback: PyObject,
+/// An internal Rust enum that implements the `StateValidityChecker` trait.
+///
+/// The native variants are evaluated entirely in Rust. The `Python` variant calls a
+/// user-provided Python function for every state, which means reacquiring the GIL and crossing
+/// the PyO3 boundary each time. The `Vectorized` variant crosses once per batch of states.
+pub enum PyStateValidityChecker {
+    /// A user-provided Python callable that takes a state and returns a `bool`.
+    Python(PyObject),
+    /// A user-provided Python callable that takes a NumPy array of states and returns a mask.
+    Vectorized(PyObject),
+    /// A native axis-aligned box over `RealVectorState`.
+    Aabb(PyAABBValidityChecker),
+    /// A native band of angles over `SO2State`.
+    AngleBand(PyAngleBandValidityChecker),
+    /// A native cone of rotations over `SO3State`.
+    SO3Cone(PySO3ConeValidityChecker),
 }
 impl Clone for PyStateValidityChecker {
     fn clone(&self) -> Self {
-        Python::with_gil(|py| Self {
-            callback: self.callback.clone_ref(py),
-        })
+        match self {
+            Self::Python(callback) => Python::with_gil(|py| Self::Python(callback.clone_ref(py))),
+            Self::Vectorized(func) => Python::with_gil(|py| Self::Vectorized(func.clone_ref(py))),
+            Self::Aabb(checker) => Self::Aabb(checker.clone()),
+            Self::AngleBand(checker) => Self::AngleBand(checker.clone()),
+            Self::SO3Cone(checker) => Self::SO3Cone(checker.clone()),
+        }
     }
 }
 
-impl StateValidityChecker<OxmplRealVectorState> for PyStateValidityChecker {
-    fn is_valid(&self, state: &OxmplRealVectorState) -> bool {
-        Python::with_gil(|py| {
-            let result: PyResult<bool> = (move || {
-                let py_state = Py::new(py, PyRealVectorState(Arc::new(state.clone())))?;
-                let args = (py_state,);
-                let result = self.callback.call1(py, args)?;
-                result.extract(py)
-            })();
-            match result {
-                Ok(is_valid) => is_valid,
-                Err(e) => {
-                    e.print(py);
-                    false
+impl PyStateValidityChecker {
+    /// Builds a checker from the object passed to a planner's `setup`.
+    ///
+    /// Native checkers are detected first so that they never go through `call1`; any other
+    /// callable is wrapped as a Python callback.
+    ///
+    /// # Errors
+    /// * `TypeError` if `obj` is neither a native checker nor callable, or if the native checker
+    ///   does not match the state space of `pd`.
+    /// * `ValueError` if an `AABBValidityChecker` has a different dimension than the space.
+    pub fn from_py(py: Python<'_>, obj: PyObject, pd: &ProblemDefinitionVariant) -> PyResult<Self> {
+        let bound = obj.bind(py);
+        let checker = if let Ok(checker) = bound.extract::<PyAABBValidityChecker>() {
+            Self::Aabb(checker)
+        } else if let Ok(checker) = bound.extract::<PyAngleBandValidityChecker>() {
+            Self::AngleBand(checker)
+        } else if let Ok(checker) = bound.extract::<PySO3ConeValidityChecker>() {
+            Self::SO3Cone(checker)
+        } else if let Ok(checker) = bound.downcast::<PyVectorizedValidityChecker>() {
+            Self::Vectorized(checker.borrow().func.clone_ref(py))
+        } else if bound.is_callable() {
+            Self::Python(obj.clone_ref(py))
+        } else {
+            return Err(PyTypeError::new_err(
+                "Validity checker must be a native checker or a callable taking a state.",
+            ));
+        };
+
+        match (&checker, pd) {
+            (Self::Python(_) | Self::Vectorized(_), _)
+            | (Self::AngleBand(_), ProblemDefinitionVariant::SO2(_))
+            | (Self::SO3Cone(_), ProblemDefinitionVariant::SO3(_)) => Ok(checker),
+            (Self::Aabb(aabb), ProblemDefinitionVariant::RealVector(pd)) => {
+                if aabb.dimension() != pd.space.dimension {
+                    return Err(PyValueError::new_err(format!(
+                        "AABBValidityChecker has {} dimensions but the space has {}.",
+                        aabb.dimension(),
+                        pd.space.dimension
+                    )));
                 }
+                Ok(checker)
+            }
+            _ => Err(PyTypeError::new_err(
+                "Native validity checker does not match the state space of the problem.",
+            )),
+        }
+    }
+}
+
+/// Calls the Python validity function, treating any raised exception as an invalid state.
+fn call_python_checker<F>(callback: &PyObject, to_py_state: F) -> bool
+where
+    F: FnOnce(Python<'_>) -> PyResult<PyObject>,
+{
+    Python::with_gil(|py| {
+        let result: PyResult<bool> = (move || {
+            let args = (to_py_state(py)?,);
+            let result = callback.call1(py, args)?;
+            result.extract(py)
+        })();
+        match result {
+            Ok(is_valid) => is_valid,
+            Err(e) => {
+                e.print(py);
+                false
+            }
+        }
+    })
+}
+
+/// Calls the vectorised Python validity function once for all `states`, packed row-wise into a
+/// NumPy array. A raised exception or a result of the wrong length marks every state as invalid.
+fn call_vectorized_checker<S: PyStateConvert>(func: &PyObject, states: &[S]) -> Vec<bool> {
+    if states.is_empty() {
+        return Vec::new();
+    }
+
+    Python::with_gil(|py| {
+        let result: PyResult<Vec<bool>> = (move || {
+            let array = states_to_ndarray(py, states)?;
+            let mask = func.call1(py, (array,))?;
+            let flags = mask
+                .bind(py)
+                .try_iter()?
+                .map(|flag| flag?.is_truthy())
+                .collect::<PyResult<Vec<bool>>>()?;
+            if flags.len() != states.len() {
+                return Err(PyValueError::new_err(format!(
+                    "Vectorized validity function returned {} results for {} states.",
+                    flags.len(),
+                    states.len()
+                )));
+            }
+            Ok(flags)
+        })();
+        match result {
+            Ok(flags) => flags,
+            Err(e) => {
+                e.print(py);
+                vec![false; states.len()]
             }
-        })
+        }
+    })
+}
+
+impl StateValidityChecker<OxmplRealVectorState> for PyStateValidityChecker {
+    fn is_valid(&self, state: &OxmplRealVectorState) -> bool {
+        match self {
+            Self::Aabb(checker) => checker.is_valid(state),
+            Self::Python(callback) => call_python_checker(callback, |py| {
+                Ok(Py::new(py, PyRealVectorState(Arc::new(state.clone())))?.into_any())
+            }),
+            Self::Vectorized(func) => call_vectorized_checker(func, std::slice::from_ref(state))[0],
+            // Mismatched native checkers are rejected in `from_py`.
+            _ => false,
+        }
+    }
+
+    fn is_valid_batch(&self, states: &[OxmplRealVectorState]) -> Vec<bool> {
+        match self {
+            Self::Vectorized(func) => call_vectorized_checker(func, states),
+            _ => states.iter().map(|state| self.is_valid(state)).collect(),
+        }
     }
 }
 
 impl StateValidityChecker<OxmplSO2State> for PyStateValidityChecker {
     fn is_valid(&self, state: &OxmplSO2State) -> bool {
-        Python::with_gil(|py| {
-            let result: PyResult<bool> = (move || {
-                let py_state = Py::new(py, PySO2State(Arc::new(state.clone())))?;
-                let args = (py_state,);
-                let result = self.callback.call1(py, args)?;
-                result.extract(py)
-            })();
-            match result {
-                Ok(is_valid) => is_valid,
-                Err(e) => {
-                    e.print(py);
-                    false
-                }
-            }
-        })
+        match self {
+            Self::AngleBand(checker) => checker.is_valid(state),
+            Self::Python(callback) => call_python_checker(callback, |py| {
+                Ok(Py::new(py, PySO2State(Arc::new(state.clone())))?.into_any())
+            }),
+            Self::Vectorized(func) => call_vectorized_checker(func, std::slice::from_ref(state))[0],
+            // Mismatched native checkers are rejected in `from_py`.
+            _ => false,
+        }
+    }
+
+    fn is_valid_batch(&self, states: &[OxmplSO2State]) -> Vec<bool> {
+        match self {
+            Self::Vectorized(func) => call_vectorized_checker(func, states),
+            _ => states.iter().map(|state| self.is_valid(state)).collect(),
+        }
     }
 }
 
 impl StateValidityChecker<OxmplSO3State> for PyStateValidityChecker {
     fn is_valid(&self, state: &OxmplSO3State) -> bool {
-        Python::with_gil(|py| {
-            let result: PyResult<bool> = (move || {
-                let py_state = Py::new(py, PySO3State(Arc::new(state.clone())))?;
-                let args = (py_state,);
-                let result = self.callback.call1(py, args)?;
-                result.extract(py)
-            })();
-            match result {
-                Ok(is_valid) => is_valid,
-                Err(e) => {
-                    e.print(py);
-                    false
-                }
-            }
-        })
+        match self {
+            Self::SO3Cone(checker) => checker.is_valid(state),
+            Self::Python(callback) => call_python_checker(callback, |py| {
+                Ok(Py::new(py, PySO3State(Arc::new(state.clone())))?.into_any())
+            }),
+            Self::Vectorized(func) => call_vectorized_checker(func, std::slice::from_ref(state))[0],
+            // Mismatched native checkers are rejected in `from_py`.
+            _ => false,
+        }
+    }
+
+    fn is_valid_batch(&self, states: &[OxmplSO3State]) -> Vec<bool> {
+        match self {
+            Self::Vectorized(func) => call_vectorized_checker(func, states),
+            _ => states.iter().map(|state| self.is_valid(state)).collect(),
+        }
     }
 }
@@ -0,0 +1,51 @@
+// Copyright (c) 2025 Junior Sundar
+//
+// SPDX-License-Identifier: BSD-3-Clause
+
+use pyo3::{exceptions::PyTypeError, prelude::*};
+
+/// Wraps a Python function that checks many states in one call.
+///
+/// The function receives a NumPy array of shape `(n, k)` with one state per row and must return
+/// `n` booleans, for example a NumPy boolean mask. Rows hold the values of a `RealVectorState`,
+/// the angle of an `SO2State` (`k = 1`) or the `[x, y, z, w]` components of an `SO3State`.
+///
+/// Planners that check states in batches, such as `PRM` while constructing its roadmap, cross
+/// into Python once per batch instead of once per state. Single checks are passed as a one-row
+/// array. NumPy must be installed to use this checker.
+///
+/// Args:
+///     func (Callable[[numpy.ndarray], Sequence[bool]]): The vectorised validity function.
+///
+/// Raises:
+///     TypeError: If `func` is not callable.
+#[pyclass(name = "VectorizedValidityChecker", unsendable)]
+pub struct PyVectorizedValidityChecker {
+    pub func: PyObject,
+}
+
+#[pymethods]
+impl PyVectorizedValidityChecker {
+    #[new]
+    fn new(py: Python<'_>, func: PyObject) -> PyResult<Self> {
+        if !func.bind(py).is_callable() {
+            return Err(PyTypeError::new_err(
+                "VectorizedValidityChecker expects a callable taking a NumPy array.",
+            ));
+        }
+        Ok(Self { func })
+    }
+
+    /// Callable: The wrapped vectorised validity function.
+    #[getter]
+    fn get_func(&self, py: Python<'_>) -> PyObject {
+        self.func.clone_ref(py)
+    }
+
+    fn __repr__(&self, py: Python<'_>) -> PyResult<String> {
+        Ok(format!(
+            "<VectorizedValidityChecker func={}>",
+            self.func.bind(py).repr()?
+        ))
+    }
+}
@@ -71,12 +71,14 @@ impl PyRrt {
         Ok(Self { planner, pd })
     }
 
-    fn setup(&mut self, validity_callback: PyObject) -> PyResult<()> {
+    fn setup(&mut self, py: Python<'_>, validity_callback: PyObject) -> PyResult<()> {
+        let checker = Arc::new(PyStateValidityChecker::from_py(
+            py,
+            validity_callback,
+            &self.pd,
+        )?);
         match &mut self.planner {
             PlannerVariant::RealVector(planner_variant) => {
-                let checker = Arc::new(PyStateValidityChecker {
-                    callback: validity_callback,
-                });
                 if let ProblemDefinitionVariant::RealVector(problem_def) = &self.pd {
                     planner_variant
                         .borrow_mut()
@@ -84,9 +86,6 @@ impl PyRrt {
                 }
             }
             PlannerVariant::SO2(planner_variant) => {
-                let checker = Arc::new(PyStateValidityChecker {
-                    callback: validity_callback,
-                });
                 if let ProblemDefinitionVariant::SO2(problem_def) = &self.pd {
                     planner_variant
                         .borrow_mut()
@@ -94,9 +93,6 @@ impl PyRrt {
                 }
             }
             PlannerVariant::SO3(planner_variant) => {
-                let checker = Arc::new(PyStateValidityChecker {
-                    callback: validity_callback,
-                });
                 if let ProblemDefinitionVariant::SO3(problem_def) = &self.pd {
                     planner_variant
                         .borrow_mut()
@@ -72,12 +72,14 @@ impl PyRrtConnect {
         Ok(Self { planner, pd })
     }
 
-    fn setup(&mut self, validity_callback: PyObject) -> PyResult<()> {
+    fn setup(&mut self, py: Python<'_>, validity_callback: PyObject) -> PyResult<()> {
+        let checker = Arc::new(PyStateValidityChecker::from_py(
+            py,
+            validity_callback,
+            &self.pd,
+        )?);
         match &mut self.planner {
             PlannerVariant::RealVector(planner_variant) => {
-                let checker = Arc::new(PyStateValidityChecker {
-                    callback: validity_callback,
-                });
                 if let ProblemDefinitionVariant::RealVector(problem_def) = &self.pd {
                     planner_variant
                         .borrow_mut()
@@ -85,9 +87,6 @@ impl PyRrtConnect {
                 }
             }
             PlannerVariant::SO2(planner_variant) => {
-                let checker = Arc::new(PyStateValidityChecker {
-                    callback: validity_callback,
-                });
                 if let ProblemDefinitionVariant::SO2(problem_def) = &self.pd {
                     planner_variant
                         .borrow_mut()
@@ -95,9 +94,6 @@ impl PyRrtConnect {
                 }
             }
             PlannerVariant::SO3(planner_variant) => {
-                let checker = Arc::new(PyStateValidityChecker {
-                    callback: validity_callback,
-                });
                 if let ProblemDefinitionVariant::SO3(problem_def) = &self.pd {
                     planner_variant
                         .borrow_mut()
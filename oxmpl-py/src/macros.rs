@@ -71,14 +71,9 @@ macro_rules! define_planner {
                 validity_callback: PyObject,
             ) -> PyResult<()> {
                 let problem_def_rust = problem_def_py.0.clone();
-                let checker = Arc::new(PyStateValidityChecker {
-                    callback: validity_callback,
-                });
                 match &problem_def_py.0 {
                     ProblemDefinitionVariant::RealVector(pd_arc) => {
-                        let checker = Arc::new(PyStateValidityChecker {
-                            callback: validity_callback,
-                        });
+                        let checker = Arc::new(PyStateValidityChecker::Python(validity_callback));
 
                         self.planner.borrow_mut().setup(pd_arc.clone(), checker);
                         Ok(())
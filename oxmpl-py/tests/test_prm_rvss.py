@@ -1,6 +1,7 @@
 import pytest
 import math
-import random
+
+import numpy as np
 
 from oxmpl_py.base import RealVectorState, RealVectorStateSpace, ProblemDefinition
 from oxmpl_py.geometric import PRM
@@ -11,36 +12,42 @@ class CircularGoal:
         self.space = space
         self.target = RealVectorState([x, y])
         self.radius = radius
-        self.rng = random.Random(123)
+        self.rng = np.random.default_rng(123)
+        # Plain floats, so sampling never reads properties of the RealVectorState.
+        self._tx, self._ty, self._r = x, y, radius
 
     def is_satisfied(self, state: RealVectorState) -> bool:
         return self.space.distance(self.target, state) <= self.radius
 
     def sample_goal(self) -> RealVectorState:
-        angle = self.rng.uniform(0, 2 * math.pi)
-        radius = self.radius * math.sqrt(self.rng.uniform(0, 1))
+        angle = 2 * math.pi * float(self.rng.random())
+        radius = self._r * math.sqrt(float(self.rng.random()))
+
+        x = self._tx + radius * math.cos(angle)
+        y = self._ty + radius * math.sin(angle)
+        return RealVectorState.from_xy(x, y)
 
-        x = self.target.values[0] + radius * math.cos(angle)
-        y = self.target.values[1] + radius * math.sin(angle)
-        return RealVectorState([x, y])
+
+# A wall of thickness 0.5 centred on x = 5.0, spanning 2.0 <= y <= 8.0.
+_WALL_X_MIN, _WALL_X_MAX = 4.75, 5.25
+_WALL_Y_MIN, _WALL_Y_MAX = 2.0, 8.0
 
 
 def is_state_valid(state: RealVectorState) -> bool:
     x, y = state.values
 
-    wall_x_pos = 5.0
-    wall_y_min = 2.0
-    wall_y_max = 8.0
-    wall_thickness = 0.5
+    is_in_wall = _WALL_X_MIN <= x <= _WALL_X_MAX and _WALL_Y_MIN <= y <= _WALL_Y_MAX
+
+    return not is_in_wall
+
 
+def are_states_valid(coords: np.ndarray) -> np.ndarray:
+    # Rows are [x, y].
+    x, y = coords[:, 0], coords[:, 1]
     is_in_wall = (
-        x >= wall_x_pos - wall_thickness / 2.0
-        and x <= wall_x_pos + wall_thickness / 2.0
-        and y >= wall_y_min
-        and y <= wall_y_max
+        (x >= _WALL_X_MIN) & (x <= _WALL_X_MAX) & (y >= _WALL_Y_MIN) & (y <= _WALL_Y_MAX)
     )
-
-    return not is_in_wall
+    return ~is_in_wall
 
 
 def test_prm_finds_path_in_rvss():
@@ -81,7 +88,8 @@ def test_prm_finds_path_in_rvss():
     path_end = path.states[-1]
     assert goal_region.is_satisfied(path_end), "Path must end inside the goal region."
 
-    for state in path.states:
-        assert is_state_valid(state), f"Path contains an invalid state: {state.values}"
+    coords = path.as_ndarray()
+    valid = are_states_valid(coords)
+    assert valid.all(), f"Path contains invalid states: {coords[~valid].tolist()}"
 
     print("Path validation successful!")
@@ -1,6 +1,7 @@
 import pytest
 import math
-import random
+
+import numpy as np
 
 from oxmpl_py.base import SO2State, SO2StateSpace, ProblemDefinition
 from oxmpl_py.geometric import PRM
@@ -11,27 +12,33 @@ class AngleGoalRegion:
         self.space = space
         self.target = SO2State(target_angle)
         self.radius = radius
-        self.rng = random.Random(456)
+        self.rng = np.random.default_rng(456)
+        self._lo = self.target.value - radius
+        self._span = 2.0 * radius
 
     def is_satisfied(self, state: SO2State) -> bool:
         return self.space.distance(self.target, state) <= self.radius
 
     def sample_goal(self) -> SO2State:
-        random_offset = self.rng.uniform(-self.radius, self.radius)
-        return SO2State(self.target.value + random_offset)
+        return SO2State(self._lo + self._span * float(self.rng.random()))
+
+
+# Angles in this band are forbidden.
+_FORBIDDEN_MIN, _FORBIDDEN_MAX = -0.5, 0.5
 
 
 def is_angle_valid(state: SO2State) -> bool:
     angle = state.value
 
-    forbidden_min = -0.5
-    forbidden_max = 0.5
-
-    is_in_forbidden_zone = angle >= forbidden_min and angle <= forbidden_max
+    is_in_forbidden_zone = _FORBIDDEN_MIN <= angle <= _FORBIDDEN_MAX
 
     return not is_in_forbidden_zone
 
 
+def are_angles_valid(angles: np.ndarray) -> np.ndarray:
+    return ~((angles >= _FORBIDDEN_MIN) & (angles <= _FORBIDDEN_MAX))
+
+
 def test_prm_finds_path_in_so2ss():
     space = SO2StateSpace()
 
@@ -64,7 +71,8 @@ def test_prm_finds_path_in_so2ss():
     path_end = path.states[-1]
     assert goal_region.is_satisfied(path_end), "Path must end inside the goal region."
 
-    for state in path.states:
-        assert is_angle_valid(state), f"Path contains an invalid state: {state.value}"
+    angles = path.as_ndarray()[:, 0]
+    valid = are_angles_valid(angles)
+    assert valid.all(), f"Path contains invalid states: {angles[~valid].tolist()}"
 
     print("Path validation successful!")
@@ -1,8 +1,14 @@
 import pytest
 import math
-import random
 
-from oxmpl_py.base import RealVectorState, RealVectorStateSpace, ProblemDefinition
+import numpy as np
+
+from oxmpl_py.base import (
+    AABBValidityChecker,
+    RealVectorState,
+    RealVectorStateSpace,
+    ProblemDefinition,
+)
 from oxmpl_py.geometric import RRTConnect
 
 
@@ -11,18 +17,29 @@ class CircularGoal:
         self.space = space
         self.target = RealVectorState([x, y])
         self.radius = radius
-        self.rng = random.Random(123)
+        self.rng = np.random.default_rng(123)
+        # Plain floats, so sampling never reads properties of the RealVectorState.
+        self._tx, self._ty, self._r = x, y, radius
 
     def is_satisfied(self, state: RealVectorState) -> bool:
         return self.space.distance(self.target, state) <= self.radius
 
     def sample_goal(self) -> RealVectorState:
-        angle = self.rng.uniform(0, 2 * math.pi)
-        radius = self.radius * math.sqrt(self.rng.uniform(0, 1))
+        # Fallback only: the planner prefers sample_goal_batch when the goal defines it.
+        angle = 2 * math.pi * float(self.rng.random())
+        radius = self._r * math.sqrt(float(self.rng.random()))
+
+        x = self._tx + radius * math.cos(angle)
+        y = self._ty + radius * math.sin(angle)
+        return RealVectorState.from_xy(x, y)
 
-        x = self.target.values[0] + radius * math.cos(angle)
-        y = self.target.values[1] + radius * math.sin(angle)
-        return RealVectorState([x, y])
+    def sample_goal_batch(self, n: int) -> np.ndarray:
+        angles = self.rng.uniform(0.0, 2 * np.pi, n)
+        radii = self._r * np.sqrt(self.rng.random(n))
+
+        xs = self._tx + radii * np.cos(angles)
+        ys = self._ty + radii * np.sin(angles)
+        return np.stack([xs, ys], axis=1)
 
 
 def is_state_valid(state: RealVectorState) -> bool:
@@ -43,6 +60,10 @@ def is_state_valid(state: RealVectorState) -> bool:
     return not is_in_wall
 
 
+# The same wall as `is_state_valid`, but checked natively without calling back into Python.
+WALL_CHECKER = AABBValidityChecker(min=[4.75, 2.0], max=[5.25, 8.0], invert=True)
+
+
 def test_rrt_connect_finds_path_in_rvss():
     space = RealVectorStateSpace(dimension=2, bounds=[(0.0, 10.0), (0.0, 10.0)])
 
@@ -55,7 +76,7 @@ def test_rrt_connect_finds_path_in_rvss():
         max_distance=0.5, goal_bias=0.05, problem_definition=problem_def
     )
 
-    planner.setup(is_state_valid)
+    planner.setup(WALL_CHECKER)
 
     print("\nAttempting to solve planning problem...")
     try:
@@ -80,3 +101,56 @@ def test_rrt_connect_finds_path_in_rvss():
         assert is_state_valid(state), f"Path contains an invalid state: {state.values}"
 
     print("Path validation successful!")
+
+
+class StateBatchGoal(CircularGoal):
+    # Returns the batch as RealVectorState objects instead of a NumPy array.
+    def sample_goal_batch(self, n: int) -> list[RealVectorState]:
+        rows = super().sample_goal_batch(n).tolist()
+        return [RealVectorState.from_xy(x, y) for x, y in rows]
+
+
+class RaggedBatchGoal(CircularGoal):
+    # The second row has an extra component.
+    def sample_goal_batch(self, n: int) -> list[list[float]]:
+        rows = super().sample_goal_batch(n).tolist()
+        rows[1].append(0.0)
+        return rows
+
+
+class WideBatchGoal(CircularGoal):
+    # Every row has a third column, which the 2D space does not have.
+    def sample_goal_batch(self, n: int) -> np.ndarray:
+        return np.column_stack([super().sample_goal_batch(n), np.zeros(n)])
+
+
+def make_wall_planner(goal_class: type[CircularGoal]) -> tuple[RRTConnect, CircularGoal]:
+    space = RealVectorStateSpace(dimension=2, bounds=[(0.0, 10.0), (0.0, 10.0)])
+    goal_region = goal_class(space, x=9.0, y=5.0, radius=0.5)
+    problem_def = ProblemDefinition.from_real_vector(
+        space, RealVectorState([1.0, 5.0]), goal_region
+    )
+    planner = RRTConnect(
+        max_distance=0.5, goal_bias=0.05, problem_definition=problem_def
+    )
+    return planner, goal_region
+
+
+def test_rrt_connect_accepts_goal_batch_of_states():
+    planner, goal_region = make_wall_planner(StateBatchGoal)
+    planner.setup(WALL_CHECKER)
+
+    path = planner.solve(timeout_secs=5.0)
+
+    assert goal_region.is_satisfied(path.states[-1]), "Path must end inside the goal region."
+
+
+@pytest.mark.parametrize("goal_class", [RaggedBatchGoal, WideBatchGoal])
+def test_rrt_connect_rejects_goal_batch_of_wrong_width(goal_class, capsys):
+    planner, _ = make_wall_planner(goal_class)
+
+    # RRTConnect roots its goal tree at a goal sample during setup, and cannot continue without
+    # one. The rejected batch is reported on stderr before the planner gives up.
+    with pytest.raises(BaseException, match="GoalRegionUnsatisfiable"):
+        planner.setup(WALL_CHECKER)
+    assert "3 components, but states in this space have 2" in capsys.readouterr().err
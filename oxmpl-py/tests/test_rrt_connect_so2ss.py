@@ -1,6 +1,7 @@
 import pytest
 import math
-import random
+
+import numpy as np
 
 from oxmpl_py.base import SO2State, SO2StateSpace, ProblemDefinition
 from oxmpl_py.geometric import RRTConnect
@@ -11,14 +12,26 @@ class AngleGoalRegion:
         self.space = space
         self.target = SO2State(target_angle)
         self.radius = radius
-        self.rng = random.Random(456)
+        self.rng = np.random.default_rng(456)
+        self._lo = self.target.value - radius
+        self._span = 2.0 * radius
 
     def is_satisfied(self, state: SO2State) -> bool:
         return self.space.distance(self.target, state) <= self.radius
 
     def sample_goal(self) -> SO2State:
-        random_offset = self.rng.uniform(-self.radius, self.radius)
-        return SO2State(self.target.value + random_offset)
+        return SO2State(self._lo + self._span * float(self.rng.random()))
+
+
+class BatchAngleGoalRegion(AngleGoalRegion):
+    # Returns the batch as a 1-D array with one angle per sample.
+    def __init__(self, space: SO2StateSpace, target_angle: float, radius: float):
+        super().__init__(space, target_angle, radius)
+        self.batch_calls = 0
+
+    def sample_goal_batch(self, n: int) -> np.ndarray:
+        self.batch_calls += 1
+        return self._lo + self._span * self.rng.random(n)
 
 
 def is_angle_valid(state: SO2State) -> bool:
@@ -70,3 +83,24 @@ def test_rrt_connect_finds_path_in_so2ss():
         assert is_angle_valid(state), f"Path contains an invalid state: {state.value}"
 
     print("Path validation successful!")
+
+
+def test_rrt_connect_accepts_1d_goal_batch_in_so2ss():
+    space = SO2StateSpace()
+
+    start_state = SO2State(-math.pi / 2.0)
+    goal_region = BatchAngleGoalRegion(space, target_angle=math.pi / 2.0, radius=0.1)
+
+    problem_def = ProblemDefinition.from_so2(space, start_state, goal_region)
+
+    planner = RRTConnect(
+        max_distance=0.5, goal_bias=0.05, problem_definition=problem_def
+    )
+    planner.setup(is_angle_valid)
+
+    path = planner.solve(timeout_secs=5.0)
+
+    assert goal_region.batch_calls > 0, "Goal samples should come from sample_goal_batch."
+    assert goal_region.is_satisfied(path.states[-1]), "Path must end inside the goal region."
+    for state in path.states:
+        assert is_angle_valid(state), f"Path contains an invalid state: {state.value}"
@@ -1,8 +1,16 @@
 import pytest
 import math
-import random
 
-from oxmpl_py.base import RealVectorState, RealVectorStateSpace, ProblemDefinition
+import numpy as np
+
+from oxmpl_py.base import (
+    AABBValidityChecker,
+    RealVectorState,
+    RealVectorStateSpace,
+    ProblemDefinition,
+    SO3ConeValidityChecker,
+    SO3State,
+)
 from oxmpl_py.geometric import RRT
 
 
@@ -11,18 +19,29 @@ class CircularGoal:
         self.space = space
         self.target = RealVectorState([x, y])
         self.radius = radius
-        self.rng = random.Random(123)
+        self.rng = np.random.default_rng(123)
+        # Plain floats, so sampling never reads properties of the RealVectorState.
+        self._tx, self._ty, self._r = x, y, radius
 
     def is_satisfied(self, state: RealVectorState) -> bool:
         return self.space.distance(self.target, state) <= self.radius
 
     def sample_goal(self) -> RealVectorState:
-        angle = self.rng.uniform(0, 2 * math.pi)
-        radius = self.radius * math.sqrt(self.rng.uniform(0, 1))
+        # Fallback only: the planner prefers sample_goal_batch when the goal defines it.
+        angle = 2 * math.pi * float(self.rng.random())
+        radius = self._r * math.sqrt(float(self.rng.random()))
+
+        x = self._tx + radius * math.cos(angle)
+        y = self._ty + radius * math.sin(angle)
+        return RealVectorState.from_xy(x, y)
+
+    def sample_goal_batch(self, n: int) -> np.ndarray:
+        angles = self.rng.uniform(0.0, 2 * np.pi, n)
+        radii = self._r * np.sqrt(self.rng.random(n))
 
-        x = self.target.values[0] + radius * math.cos(angle)
-        y = self.target.values[1] + radius * math.sin(angle)
-        return RealVectorState([x, y])
+        xs = self._tx + radii * np.cos(angles)
+        ys = self._ty + radii * np.sin(angles)
+        return np.stack([xs, ys], axis=1)
 
 
 def is_state_valid(state: RealVectorState) -> bool:
@@ -43,6 +62,10 @@ def is_state_valid(state: RealVectorState) -> bool:
     return not is_in_wall
 
 
+# The same wall as `is_state_valid`, but checked natively without calling back into Python.
+WALL_CHECKER = AABBValidityChecker(min=[4.75, 2.0], max=[5.25, 8.0], invert=True)
+
+
 def test_rrt_finds_path_in_rvss():
     space = RealVectorStateSpace(dimension=2, bounds=[(0.0, 10.0), (0.0, 10.0)])
 
@@ -53,7 +76,7 @@ def test_rrt_finds_path_in_rvss():
 
     planner = RRT(max_distance=0.5, goal_bias=0.05, problem_definition=problem_def)
 
-    planner.setup(is_state_valid)
+    planner.setup(WALL_CHECKER)
 
     print("\nAttempting to solve planning problem...")
     try:
@@ -78,3 +101,35 @@ def test_rrt_finds_path_in_rvss():
         assert is_state_valid(state), f"Path contains an invalid state: {state.values}"
 
     print("Path validation successful!")
+
+
+def test_aabb_validity_checker_matches_python_checker():
+    rng = np.random.default_rng(789)
+    for x, y in rng.uniform(0.0, 10.0, size=(1000, 2)).tolist():
+        state = RealVectorState.from_xy(x, y)
+        assert WALL_CHECKER(state) == is_state_valid(state), (
+            f"Native checker disagrees with Python checker at {state.values}"
+        )
+
+
+def make_wall_planner() -> RRT:
+    space = RealVectorStateSpace(dimension=2, bounds=[(0.0, 10.0), (0.0, 10.0)])
+    goal_region = CircularGoal(space, x=9.0, y=5.0, radius=0.5)
+    problem_def = ProblemDefinition.from_real_vector(
+        space, RealVectorState([1.0, 5.0]), goal_region
+    )
+    return RRT(max_distance=0.5, goal_bias=0.05, problem_definition=problem_def)
+
+
+def test_aabb_validity_checker_rejects_dimension_mismatch():
+    planner = make_wall_planner()
+    checker = AABBValidityChecker(min=[4.75, 2.0, 0.0], max=[5.25, 8.0, 1.0])
+    with pytest.raises(ValueError):
+        planner.setup(checker)
+
+
+def test_native_checker_for_other_space_is_rejected():
+    planner = make_wall_planner()
+    checker = SO3ConeValidityChecker(center=SO3State(0.0, 0.0, 0.0, 1.0), radius=0.5)
+    with pytest.raises(TypeError):
+        planner.setup(checker)
@@ -1,26 +1,16 @@
 import pytest
 import math
-import random
 
-from oxmpl_py.base import SO2State, SO2StateSpace, ProblemDefinition
+from oxmpl_py.base import (
+    AngleBandValidityChecker,
+    AngleGoalRegion,
+    ProblemDefinition,
+    SO2State,
+    SO2StateSpace,
+)
 from oxmpl_py.geometric import RRT
 
 
-class AngleGoalRegion:
-    def __init__(self, space: SO2StateSpace, target_angle: float, radius: float):
-        self.space = space
-        self.target = SO2State(target_angle)
-        self.radius = radius
-        self.rng = random.Random(456)
-
-    def is_satisfied(self, state: SO2State) -> bool:
-        return self.space.distance(self.target, state) <= self.radius
-
-    def sample_goal(self) -> SO2State:
-        random_offset = self.rng.uniform(-self.radius, self.radius)
-        return SO2State(self.target.value + random_offset)
-
-
 def is_angle_valid(state: SO2State) -> bool:
     angle = state.value
 
@@ -33,17 +23,22 @@ def is_angle_valid(state: SO2State) -> bool:
     return not is_in_forbidden_zone
 
 
+# Native equivalent of `is_angle_valid`. With `AngleGoalRegion`, the planner runs without any
+# Python callbacks; the Python function is kept to validate the returned path.
+FORBIDDEN_BAND = AngleBandValidityChecker(-0.5, 0.5, invert=True)
+
+
 def test_rrt_finds_path_in_so2ss():
     space = SO2StateSpace()
 
     start_state = SO2State(-math.pi / 2.0)  # Start at -90 degrees
-    goal_region = AngleGoalRegion(space, target_angle=math.pi / 2.0, radius=0.1)
+    goal_region = AngleGoalRegion(space, SO2State(math.pi / 2.0), radius=0.1)
 
     problem_def = ProblemDefinition.from_so2(space, start_state, goal_region)
 
     planner = RRT(max_distance=0.5, goal_bias=0.05, problem_definition=problem_def)
 
-    planner.setup(is_angle_valid)
+    planner.setup(FORBIDDEN_BAND)
 
     print("\nAttempting to solve SO(2) planning problem...")
     try:
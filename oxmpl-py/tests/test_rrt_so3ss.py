@@ -1,10 +1,17 @@
 import pytest
 import math
-import random
 
-from oxmpl_py.base import SO3State, SO3StateSpace, ProblemDefinition
+import numpy as np
+
+from oxmpl_py.base import (
+    SO3ConeValidityChecker,
+    SO3State,
+    SO3StateSpace,
+    ProblemDefinition,
+)
 from oxmpl_py.geometric import RRT
 
+
 def quaternion_from_axis_angle(axis: tuple[float, float, float], angle: float) -> SO3State:
     half_angle = angle * 0.5
     s = math.sin(half_angle)
@@ -16,37 +23,63 @@ class QuaternionGoalRegion:
         self.space = space
         self.target = target
         self.radius = radius
-        self.rng = random.Random(123)
+        # The space distance is acos(|dot|), so the radius test reduces to comparing |dot|
+        # against cos(radius), which is fixed.
+        self._cos_radius = math.cos(radius)
+        self.rng = np.random.default_rng(123)
+        self._target_components = (target.x, target.y, target.z, target.w)
 
     def is_satisfied(self, state: SO3State) -> bool:
-        return self.space.distance(self.target, state) <= self.radius
+        t = self.target
+        dot = t.x * state.x + t.y * state.y + t.z * state.z + t.w * state.w
+        return abs(dot) >= self._cos_radius
 
     def sample_goal(self) -> SO3State:
+        # Sample the cap around the target directly: rotate the target by 2 * d about a uniformly
+        # random axis, which puts the sample at distance d. Within a cap of radius r on S^3, d has
+        # density proportional to sin(d)^2, so d = r * u^(1/3) is drawn and then accepted with
+        # probability (sin(d) / d)^2. For small radii almost every draw is accepted.
+        rnd = self.rng.random
+        r = min(self.radius, 0.5 * math.pi)
         while True:
-            x, y, z, w = [self.rng.uniform(-1.0, 1.0) for _ in range(4)]
-            norm_sq = x*x + y*y + z*z + w*w
-            if 1e-9 < norm_sq < 1.0:
-                norm = math.sqrt(norm_sq)
-                random_quat = SO3State(x/norm, y/norm, z/norm, w/norm)
-                if self.is_satisfied(random_quat):
-                    return random_quat
-
-# A global instance of the space is needed for the validity checker function
-# because Python functions can't have member variables like classes do.
-FORBIDDEN_ZONE_SPACE = SO3StateSpace()
+            d = r * rnd() ** (1.0 / 3.0)
+            if d == 0.0 or rnd() * d * d <= math.sin(d) ** 2:
+                break
+        # Marsaglia's method for a uniformly distributed unit axis.
+        while True:
+            a1 = 2.0 * rnd() - 1.0
+            a2 = 2.0 * rnd() - 1.0
+            s = a1 * a1 + a2 * a2
+            if s < 1.0:
+                break
+        f = 2.0 * math.sqrt(1.0 - s)
+        sin_d = math.sin(d)
+        dx, dy, dz, dw = a1 * f * sin_d, a2 * f * sin_d, (1.0 - 2.0 * s) * sin_d, math.cos(d)
+        # Hamilton product delta * target.
+        tx, ty, tz, tw = self._target_components
+        return SO3State(
+            dw * tx + dx * tw + dy * tz - dz * ty,
+            dw * ty - dx * tz + dy * tw + dz * tx,
+            dw * tz + dx * ty - dy * tx + dz * tw,
+            dw * tw - dx * tx - dy * ty - dz * tz,
+        )
+
+# The forbidden zone is centred on the identity, whose distance to a rotation is acos(|w|).
+# A rotation lies outside the zone exactly when |w| is below the cosine of its radius.
+_MAX_ABS_W = math.cos(math.radians(44.9))
 
 def is_rotation_valid(state: SO3State) -> bool:
-    forbidden_center = SO3State.identity()
-    forbidden_radius = math.radians(44.9)
+    return abs(state.w) < _MAX_ABS_W
 
-    distance_from_center = FORBIDDEN_ZONE_SPACE.distance(forbidden_center, state)
 
-    return distance_from_center > forbidden_radius
+# The same forbidden zone as `is_rotation_valid`, but checked natively without calling back into
+# Python.
+FORBIDDEN_CONE = SO3ConeValidityChecker(
+    center=SO3State(0.0, 0.0, 0.0, 1.0), radius=math.radians(44.9), invert=True
+)
 
 def test_rrt_finds_path_in_so3ss():
     space = SO3StateSpace()
-    global FORBIDDEN_ZONE_SPACE
-    FORBIDDEN_ZONE_SPACE = space
 
     start_state = quaternion_from_axis_angle(axis=(0.0, 1.0, 0.0), angle=math.pi / 2.0)
     goal_target = quaternion_from_axis_angle(axis=(0.0, 1.0, 0.0), angle=-math.pi / 2.0)
@@ -55,7 +88,7 @@ def test_rrt_finds_path_in_so3ss():
     problem_def = ProblemDefinition.from_so3(space, start_state, goal_region)
 
     planner = RRT(max_distance=0.5, goal_bias=0.05, problem_definition=problem_def)
-    planner.setup(is_rotation_valid)
+    planner.setup(FORBIDDEN_CONE)
 
     print("\nAttempting to solve SO(3) planning problem...")
     try:
@@ -78,3 +111,15 @@ def test_rrt_finds_path_in_so3ss():
         assert is_rotation_valid(state), f"Path contains an invalid state at index {i}: {state}"
 
     print("Path validation successful!")
+
+
+def test_so3_cone_validity_checker_matches_python_checker():
+    rng = np.random.default_rng(789)
+    # Normalised Gaussian vectors are uniformly distributed rotations.
+    quaternions = rng.standard_normal(size=(1000, 4))
+    quaternions /= np.linalg.norm(quaternions, axis=1, keepdims=True)
+    for x, y, z, w in quaternions.tolist():
+        state = SO3State(x, y, z, w)
+        assert FORBIDDEN_CONE(state) == is_rotation_valid(state), (
+            f"Native checker disagrees with Python checker at {state}"
+        )
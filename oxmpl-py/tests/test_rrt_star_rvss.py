@@ -1,6 +1,7 @@
 import pytest
 import math
-import random
+
+import numpy as np
 
 from oxmpl_py.base import RealVectorState, RealVectorStateSpace, ProblemDefinition
 from oxmpl_py.geometric import RRTStar
@@ -11,18 +12,20 @@ class CircularGoal:
         self.space = space
         self.target = RealVectorState([x, y])
         self.radius = radius
-        self.rng = random.Random(123)
+        self.rng = np.random.default_rng(123)
+        # Plain floats, so sampling never reads properties of the RealVectorState.
+        self._tx, self._ty, self._r = x, y, radius
 
     def is_satisfied(self, state: RealVectorState) -> bool:
         return self.space.distance(self.target, state) <= self.radius
 
     def sample_goal(self) -> RealVectorState:
-        angle = self.rng.uniform(0, 2 * math.pi)
-        radius = self.radius * math.sqrt(self.rng.uniform(0, 1))
+        angle = 2 * math.pi * float(self.rng.random())
+        radius = self._r * math.sqrt(float(self.rng.random()))
 
-        x = self.target.values[0] + radius * math.cos(angle)
-        y = self.target.values[1] + radius * math.sin(angle)
-        return RealVectorState([x, y])
+        x = self._tx + radius * math.cos(angle)
+        y = self._ty + radius * math.sin(angle)
+        return RealVectorState.from_xy(x, y)
 
 
 def is_state_valid(state: RealVectorState) -> bool:
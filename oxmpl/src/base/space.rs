@@ -90,6 +90,70 @@ pub trait StateSpace {
     /// * `state2` - The second state.
     fn distance(&self, state1: &Self::StateType, state2: &Self::StateType) -> f64;
 
+    /// Computes a cheap surrogate for `distance` that orders pairs of states the same way.
+    ///
+    /// Planners use this wherever only comparisons between distances matter, such as finding the
+    /// nearest node in a tree. It allows a space to skip the final `sqrt` or `acos` of its
+    /// metric. The value itself carries no meaning beyond its ordering.
+    ///
+    /// The default implementation returns `distance`.
+    ///
+    /// # Parameters
+    /// * `state1` - The first state.
+    /// * `state2` - The second state.
+    fn distance_proxy(&self, state1: &Self::StateType, state2: &Self::StateType) -> f64 {
+        self.distance(state1, state2)
+    }
+
+    /// Converts a distance threshold to the scale of `distance_proxy`.
+    ///
+    /// For every pair of states, `distance(a, b) < threshold` must hold exactly when
+    /// `distance_proxy(a, b) < proxy_threshold(threshold)`. Radius queries convert their radius
+    /// once and then compare proxies for each candidate, so the loop itself needs no `sqrt`,
+    /// `acos` or `cos`.
+    ///
+    /// The default implementation returns `threshold`, which matches the default
+    /// `distance_proxy`.
+    ///
+    /// # Parameters
+    /// * `threshold` - A distance in this space's metric.
+    fn proxy_threshold(&self, threshold: f64) -> f64 {
+        threshold
+    }
+
+    /// Maps a state to one or more points in a Euclidean space, for use in spatial indices.
+    ///
+    /// The embedding must be such that, whenever `distance(a, b) < r`, some point of `embed(a)`
+    /// lies within Euclidean distance `embedded_radius(r)` of the first point of `embed(b)`. A
+    /// spatial index can then store every point of every state and query with the first point
+    /// only, confirming the candidates it returns by comparing `distance_proxy` against
+    /// `proxy_threshold`. Spaces whose states
+    /// are identified under a symmetry (such as `q` and `-q` in `SO3StateSpace`) return one point
+    /// per representative.
+    ///
+    /// The Euclidean distance between the closest such pair of points must also increase with
+    /// `distance`, so that the nearest point in the embedding belongs to the nearest state.
+    ///
+    /// The default implementation returns `None`, meaning the space has no such embedding and
+    /// planners fall back to a linear scan.
+    ///
+    /// # Parameters
+    /// * `state` - The state to embed.
+    fn embed(&self, _state: &Self::StateType) -> Option<Vec<Vec<f64>>> {
+        None
+    }
+
+    /// Converts a radius in this space's metric into a Euclidean radius for points produced by
+    /// `embed`. See `embed` for the required guarantee.
+    ///
+    /// The default implementation returns `radius` unchanged.
+    ///
+    /// # Parameters
+    /// * `radius` - A distance in this space's metric.
+    fn embedded_radius(&self, radius: f64) -> f64 {
+        radius
+    }
+
     /// Find state interpolated between `from` and `to` states given 0<=`t`<=1.
     ///
     /// The resulting state is a point on the path between `from` and `to`, determined by the
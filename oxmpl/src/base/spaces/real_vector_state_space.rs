@@ -154,6 +154,41 @@ impl StateSpace for RealVectorStateSpace {
             .sqrt()
     }
 
+    /// Returns the squared L2-norm, which orders states like `distance` without the `sqrt`.
+    fn distance_proxy(&self, state1: &Self::StateType, state2: &Self::StateType) -> f64 {
+        assert_eq!(
+            state1.values.len(),
+            self.dimension,
+            "State1 has incorrect dimension for this space."
+        );
+        assert_eq!(
+            state2.values.len(),
+            self.dimension,
+            "State2 has incorrect dimension for this space."
+        );
+        state1
+            .values
+            .iter()
+            .zip(state2.values.iter())
+            .map(|(v1, v2)| (v1 - v2).powi(2))
+            .sum::<f64>()
+    }
+
+    /// Returns `threshold^2`, the threshold on the squared distance. Non-positive and NaN
+    /// thresholds map to `0.0`, which no squared distance is below.
+    fn proxy_threshold(&self, threshold: f64) -> f64 {
+        if threshold > 0.0 {
+            threshold * threshold
+        } else {
+            0.0
+        }
+    }
+
+    /// The values of the state are used directly, so the embedded radius is the radius itself.
+    fn embed(&self, state: &Self::StateType) -> Option<Vec<Vec<f64>>> {
+        Some(vec![state.values.clone()])
+    }
+
     /// Performs linear interpolation between two states.
     ///
     /// The resulting state's components are calculated as:
@@ -252,3 +287,28 @@ impl StateSpace for RealVectorStateSpace {
         self.get_maximum_extent() * self.longest_valid_segment_fraction
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_real_vector_proxy_threshold_matches_distance() {
+        let space = RealVectorStateSpace::new(3, None).unwrap();
+        let origin = RealVectorState::new(vec![0.0, 0.0, 0.0]);
+        let state = RealVectorState::new(vec![1.0, 2.0, 2.0]);
+        // A NaN component makes both comparisons false.
+        let nan_state = RealVectorState::new(vec![0.0, f64::NAN, 0.0]);
+        for (a, b) in [(&origin, &state), (&origin, &origin), (&nan_state, &origin)] {
+            let distance = space.distance(a, b);
+            let proxy = space.distance_proxy(a, b);
+            for threshold in [-1.0, 0.0, 0.5, 2.9, 3.5, f64::INFINITY, f64::NAN] {
+                assert_eq!(
+                    proxy < space.proxy_threshold(threshold),
+                    distance < threshold,
+                    "Mismatch for distance {distance} and threshold {threshold}"
+                );
+            }
+        }
+    }
+}
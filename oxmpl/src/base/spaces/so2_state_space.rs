@@ -3,7 +3,7 @@
 // SPDX-License-Identifier: BSD-3-Clause
 
 use rand::Rng;
-use std::f64::consts::PI;
+use std::f64::consts::{PI, TAU};
 
 use crate::base::{
     error::{StateSamplingError, StateSpaceError},
@@ -94,10 +94,24 @@ impl StateSpace for SO2StateSpace {
     type StateType = SO2State;
 
     /// Computes the shortest angle (in radians) between two states.
+    ///
+    /// The difference is wrapped by subtracting the nearest multiple of `2 * PI`, which compiles
+    /// to a rounding instruction rather than a branch.
     fn distance(&self, state1: &Self::StateType, state2: &Self::StateType) -> f64 {
-        let mut diff = state1.value - state2.value;
-        diff = (diff + PI).rem_euclid(2.0 * PI) - PI;
-        diff.abs()
+        let diff = state1.value - state2.value;
+        (diff - TAU * (diff / TAU).round()).abs()
+    }
+
+    /// Embeds the angle as the point `(cos, sin)` on the unit circle.
+    fn embed(&self, state: &Self::StateType) -> Option<Vec<Vec<f64>>> {
+        let (sin, cos) = state.value.sin_cos();
+        Some(vec![vec![cos, sin]])
+    }
+
+    /// The chord length between two points on the unit circle separated by `radius`, padded
+    /// slightly for rounding.
+    fn embedded_radius(&self, radius: f64) -> f64 {
+        2.0 * (0.5 * radius.min(PI)).sin() + 1e-9
     }
 
     /// Performs linear interpolation between two states. Also normalises the result.
@@ -169,3 +183,38 @@ impl StateSpace for SO2StateSpace {
         self.get_maximum_extent() * self.longest_valid_segment_fraction
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_so2_distance_is_shortest_wrapped_angle() {
+        let space = SO2StateSpace::new(None).unwrap();
+        let angles = [
+            -3.0 * PI,
+            -PI,
+            -2.5,
+            -0.3,
+            0.0,
+            0.1,
+            1.0,
+            PI - 1e-3,
+            PI,
+            4.0,
+            7.5,
+        ];
+        for &a in &angles {
+            for &b in &angles {
+                let wrapped = (a - b).rem_euclid(TAU);
+                let expected = wrapped.min(TAU - wrapped);
+                let distance = space.distance(&SO2State { value: a }, &SO2State { value: b });
+                assert!(
+                    (distance - expected).abs() < 1e-12,
+                    "Distance between {a} and {b} was {distance}, expected {expected}"
+                );
+                assert!((0.0..=PI).contains(&distance));
+            }
+        }
+    }
+}
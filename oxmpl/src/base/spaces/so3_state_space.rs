@@ -95,14 +95,36 @@ impl SO3StateSpace {
     }
 }
 
+/// The 4D dot product between two quaternions.
+///
+/// Where the target is known to have fused multiply-add, the sum is chained through `mul_add`
+/// for a single rounding per term. Elsewhere `mul_add` would fall back to a slow software `fma`,
+/// so the plain expression is used instead.
+#[cfg(any(target_feature = "fma", target_arch = "aarch64"))]
+fn dot(q1: &SO3State, q2: &SO3State) -> f64 {
+    q1.x.mul_add(q2.x, q1.y.mul_add(q2.y, q1.z.mul_add(q2.z, q1.w * q2.w)))
+}
+
+/// The 4D dot product between two quaternions.
+#[cfg(not(any(target_feature = "fma", target_arch = "aarch64")))]
+fn dot(q1: &SO3State, q2: &SO3State) -> f64 {
+    q1.x * q2.x + q1.y * q2.y + q1.z * q2.z + q1.w * q2.w
+}
+
+/// The absolute value of the 4D dot product between two quaternions.
+fn abs_dot(q1: &SO3State, q2: &SO3State) -> f64 {
+    dot(q1, q2).abs()
+}
+
 impl StateSpace for SO3StateSpace {
     type StateType = SO3State;
 
     /// Computes the shortest angle between two rotations using the quaternion dot product.
+    ///
+    /// This is `acos(|q1 . q2|)`, where taking the absolute value accounts for `q` and `-q`
+    /// representing the same rotation.
     fn distance(&self, state1: &Self::StateType, state2: &Self::StateType) -> f64 {
-        let abs_dot =
-            (state1.x * state2.x + state1.y * state2.y + state1.z * state2.z + state1.w * state2.w)
-                .abs();
+        let abs_dot = abs_dot(state1, state2);
         if abs_dot > 1.0 - 1e-9 {
             0.
         } else {
@@ -110,6 +132,39 @@ impl StateSpace for SO3StateSpace {
         }
     }
 
+    /// Returns `1 - |q1 . q2|`, which is monotone in `distance` but needs no `acos`.
+    fn distance_proxy(&self, state1: &Self::StateType, state2: &Self::StateType) -> f64 {
+        1.0 - abs_dot(state1, state2)
+    }
+
+    /// Since `distance` is `acos(|dot|)`, which is decreasing in `|dot|`, a threshold `t` becomes
+    /// `1 - cos(t)`. It is raised to `1e-9` to include the pairs that `distance` snaps to zero.
+    fn proxy_threshold(&self, threshold: f64) -> f64 {
+        if threshold.is_nan() || threshold <= 0.0 {
+            f64::NEG_INFINITY
+        } else if threshold > 0.5 * PI {
+            // Every pair is closer than PI / 2.
+            f64::INFINITY
+        } else {
+            (1.0 - threshold.cos()).max(1e-9)
+        }
+    }
+
+    /// Embeds the quaternion as both `[x, y, z, w]` and `[-x, -y, -z, -w]` in R^4, so that the
+    /// double cover is handled by the index rather than by the query.
+    fn embed(&self, state: &Self::StateType) -> Option<Vec<Vec<f64>>> {
+        Some(vec![
+            vec![state.x, state.y, state.z, state.w],
+            vec![-state.x, -state.y, -state.z, -state.w],
+        ])
+    }
+
+    /// The chord length between two unit quaternions separated by `radius`, padded to also cover
+    /// the pairs that `distance` snaps to zero.
+    fn embedded_radius(&self, radius: f64) -> f64 {
+        2.0 * (0.5 * radius.min(0.5 * PI)).sin() + 1e-4
+    }
+
     /// Performs Spherical Linear Interpolation (SLERP) between two states.
     ///
     /// The resulting state's components are calculated as:
@@ -121,7 +176,7 @@ impl StateSpace for SO3StateSpace {
         t: f64,
         out_state: &mut Self::StateType,
     ) {
-        let mut dot = from.x * to.x + from.y * to.y + from.z * to.z + from.w * to.w;
+        let mut dot = dot(from, to);
 
         let sign = if dot < 0.0 { -1.0 } else { 1.0 };
         dot *= sign;
@@ -235,3 +290,94 @@ impl StateSpace for SO3StateSpace {
         self.get_maximum_extent() * self.longest_valid_segment_fraction
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn rotation_about_z(angle: f64) -> SO3State {
+        SO3State::new(0.0, 0.0, (angle * 0.5).sin(), (angle * 0.5).cos())
+    }
+
+    #[test]
+    fn test_so3_distance_is_zero_for_antipodal_quaternions() {
+        let space = SO3StateSpace::new(None).unwrap();
+        let q = rotation_about_z(0.7);
+        let neg_q = SO3State::new(-q.x, -q.y, -q.z, -q.w);
+        assert_eq!(space.distance(&q, &neg_q), 0.0);
+        assert_eq!(space.distance(&q, &q), 0.0);
+    }
+
+    #[test]
+    fn test_so3_proxy_threshold_matches_distance() {
+        let space = SO3StateSpace::new(None).unwrap();
+        let origin = SO3State::identity();
+        for angle in [0.0, 1e-6, 0.05, 0.4, 1.2, 2.5, PI] {
+            let state = rotation_about_z(angle);
+            let distance = space.distance(&origin, &state);
+            let proxy = space.distance_proxy(&origin, &state);
+            for threshold in [
+                -1.0,
+                0.0,
+                1e-5,
+                0.01,
+                0.3,
+                0.7,
+                1.5,
+                2.0,
+                f64::INFINITY,
+                f64::NAN,
+            ] {
+                if (distance - threshold).abs() < 1e-9 {
+                    continue;
+                }
+                assert_eq!(
+                    proxy < space.proxy_threshold(threshold),
+                    distance < threshold,
+                    "Mismatch for angle {angle} and threshold {threshold}"
+                );
+            }
+        }
+    }
+
+    #[test]
+    fn test_so3_embedding_bounds_distance() {
+        let space = SO3StateSpace::new(None).unwrap();
+        let query = rotation_about_z(0.3);
+        let query_point = &space.embed(&query).unwrap()[0];
+        for angle in [0.3, 0.5, 1.0, -2.0, 3.0, 2.0 * PI + 0.2] {
+            let state = rotation_about_z(angle);
+            let radius = space.distance(&query, &state) + 1e-6;
+            let chord = space
+                .embed(&state)
+                .unwrap()
+                .iter()
+                .map(|point| {
+                    point
+                        .iter()
+                        .zip(query_point)
+                        .map(|(a, b)| (a - b).powi(2))
+                        .sum::<f64>()
+                        .sqrt()
+                })
+                .fold(f64::INFINITY, f64::min);
+            assert!(
+                chord <= space.embedded_radius(radius),
+                "Chord {chord} exceeds embedded radius for angle {angle}"
+            );
+        }
+    }
+
+    #[test]
+    fn test_so3_distance_proxy_preserves_ordering() {
+        let space = SO3StateSpace::new(None).unwrap();
+        let origin = SO3State::identity();
+        let angles = [0.1, 0.5, 1.0, 2.0, 3.0];
+        for pair in angles.windows(2) {
+            let near = rotation_about_z(pair[0]);
+            let far = rotation_about_z(pair[1]);
+            assert!(space.distance(&origin, &near) < space.distance(&origin, &far));
+            assert!(space.distance_proxy(&origin, &near) < space.distance_proxy(&origin, &far));
+        }
+    }
+}
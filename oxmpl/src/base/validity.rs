@@ -45,4 +45,19 @@ pub trait StateValidityChecker<S: state::State> {
     /// # Returns
     /// Returns `true` if the state is valid, and `false` otherwise.
     fn is_valid(&self, state: &S) -> bool;
+
+    /// Checks a batch of states at once.
+    ///
+    /// Checkers with a fixed cost per call, such as those that call into another language, can
+    /// override this to pay that cost once per batch. The default implementation calls `is_valid`
+    /// on each state.
+    ///
+    /// # Parameters
+    /// * `states` - The states to be checked.
+    ///
+    /// # Returns
+    /// Returns one flag per state, in the same order, which is `true` if that state is valid.
+    fn is_valid_batch(&self, states: &[S]) -> Vec<bool> {
+        states.iter().map(|state| self.is_valid(state)).collect()
+    }
 }
@@ -0,0 +1,427 @@
+// Copyright (c) 2025 Junior Sundar
+//
+// SPDX-License-Identifier: BSD-3-Clause
+
+/// An immutable weighted graph stored in compressed sparse row (CSR) form.
+///
+/// The outgoing edges of every node sit next to each other in one flat array, so iterating over a
+/// node's neighbours is a sequential read rather than a walk through per-node allocations. Node
+/// indices are stored as `u32` and weights as `f32`, which halves the memory traffic of a graph
+/// search compared with `usize`/`f64`.
+///
+/// # Examples
+///
+/// ```
+/// use oxmpl::datastructures::csr_graph::CsrGraph;
+///
+/// // 0 -- 1 -- 2
+/// let graph = CsrGraph::from_adjacency(vec![
+///     vec![(1, 1.0)],
+///     vec![(0, 1.0), (2, 0.5)],
+///     vec![(1, 0.5)],
+/// ]);
+/// assert_eq!(graph.num_nodes(), 3);
+/// assert_eq!(graph.num_edges(), 4);
+/// assert_eq!(graph.neighbours(1).collect::<Vec<_>>(), vec![(0, 1.0), (2, 0.5)]);
+/// ```
+#[derive(Clone, Debug, Default)]
+pub struct CsrGraph {
+    /// The edges of node `u` are at `row_ptr[u]..row_ptr[u + 1]` in `col` and `weight`.
+    row_ptr: Vec<u32>,
+    col: Vec<u32>,
+    weight: Vec<f32>,
+}
+
+impl CsrGraph {
+    /// Builds a graph from one list of `(neighbour, weight)` pairs per node, in node order.
+    ///
+    /// # Panics
+    /// Panics if the graph has `u32::MAX` or more nodes or edges, or if an edge points to a node
+    /// that does not exist.
+    pub fn from_adjacency<I, E>(adjacency: I) -> Self
+    where
+        I: IntoIterator<Item = E>,
+        E: IntoIterator<Item = (usize, f32)>,
+    {
+        let mut graph = Self {
+            row_ptr: vec![0],
+            col: Vec::new(),
+            weight: Vec::new(),
+        };
+        for edges in adjacency {
+            for (v, w) in edges {
+                graph.col.push(to_u32(v));
+                graph.weight.push(w);
+            }
+            graph.row_ptr.push(to_u32(graph.col.len()));
+        }
+        let num_nodes = graph.num_nodes();
+        assert!(
+            graph.col.iter().all(|&v| (v as usize) < num_nodes),
+            "CsrGraph edge points to a node outside the graph."
+        );
+        graph
+    }
+
+    /// Returns the number of nodes.
+    pub fn num_nodes(&self) -> usize {
+        self.row_ptr.len().saturating_sub(1)
+    }
+
+    /// Returns the number of directed edges. An undirected edge counts twice.
+    pub fn num_edges(&self) -> usize {
+        self.col.len()
+    }
+
+    /// Returns the `(neighbour, weight)` pairs of the edges leaving `node`.
+    ///
+    /// # Panics
+    /// Panics if `node` is not in the graph.
+    pub fn neighbours(&self, node: usize) -> impl Iterator<Item = (usize, f32)> + '_ {
+        let range = self.row_ptr[node] as usize..self.row_ptr[node + 1] as usize;
+        self.col[range.clone()]
+            .iter()
+            .zip(&self.weight[range])
+            .map(|(&v, &w)| (v as usize, w))
+    }
+}
+
+/// The outcome of `CsrGraph::delta_stepping`.
+#[derive(Clone, Debug)]
+pub struct ShortestPaths {
+    /// The cheapest goal node reached, or `None` if no goal is reachable from the sources.
+    pub goal: Option<usize>,
+    /// The path cost of every node. Costs are final for the goal and every node cheaper than it;
+    /// other nodes may hold tentative costs or `f64::INFINITY`.
+    pub cost: Vec<f64>,
+    /// The predecessor of every node on its cheapest known path, `None` for sources and
+    /// unreached nodes.
+    pub parents: Vec<Option<usize>>,
+}
+
+impl CsrGraph {
+    /// Finds the cheapest path from any of `sources` to any node flagged in `is_goal`, using
+    /// sequential delta-stepping.
+    ///
+    /// Nodes are kept in buckets of width `delta` by tentative cost, and each bucket is a plain
+    /// `Vec` walked in insertion order, so no heap operations are needed. Once a bucket has been
+    /// emptied, every node whose cost falls inside it is final, so the search stops after the
+    /// first bucket in which a goal is settled. A `delta` around half the longest edge keeps
+    /// every relaxation within a couple of buckets of the current one.
+    ///
+    /// # Parameters
+    /// * `sources` - Pairs of a start node and its initial cost.
+    /// * `is_goal` - One flag per node.
+    /// * `delta` - The bucket width. `f64::INFINITY` puts every node in a single bucket.
+    /// * `should_stop` - Polled once per processed node. The search returns `None` as soon as it
+    ///   returns `true`.
+    ///
+    /// # Panics
+    /// Panics if `is_goal` does not have one entry per node, or if `delta` is not positive.
+    pub fn delta_stepping(
+        &self,
+        sources: &[(usize, f64)],
+        is_goal: &[bool],
+        delta: f64,
+        mut should_stop: impl FnMut() -> bool,
+    ) -> Option<ShortestPaths> {
+        assert_eq!(
+            is_goal.len(),
+            self.num_nodes(),
+            "is_goal must have one flag per node."
+        );
+        assert!(delta > 0.0, "Bucket width must be positive.");
+
+        let bucket_of = |cost: f64| (cost / delta) as usize;
+        let push = |buckets: &mut Vec<Vec<(usize, f64)>>, node: usize, node_cost: f64| {
+            let b = bucket_of(node_cost);
+            if b >= buckets.len() {
+                buckets.resize_with(b + 1, Vec::new);
+            }
+            buckets[b].push((node, node_cost));
+        };
+
+        let mut cost = vec![f64::INFINITY; self.num_nodes()];
+        let mut parents: Vec<Option<usize>> = vec![None; self.num_nodes()];
+        let mut buckets: Vec<Vec<(usize, f64)>> = Vec::new();
+        for &(node, node_cost) in sources {
+            if node_cost < cost[node] {
+                cost[node] = node_cost;
+                push(&mut buckets, node, node_cost);
+            }
+        }
+
+        let mut goal: Option<usize> = None;
+        let mut b = 0;
+        while b < buckets.len() {
+            // Relaxations can append to the current bucket, so walk it by position.
+            let mut next = 0;
+            while let Some(&(u, u_cost)) = buckets[b].get(next) {
+                next += 1;
+                if should_stop() {
+                    return None;
+                }
+
+                // Skip entries left behind after the node's cost was lowered again.
+                if u_cost > cost[u] {
+                    continue;
+                }
+
+                if is_goal[u] && goal.is_none_or(|g| u_cost < cost[g]) {
+                    goal = Some(u);
+                }
+
+                for (v, length) in self.neighbours(u) {
+                    let v_cost = u_cost + f64::from(length);
+                    if v_cost < cost[v] {
+                        cost[v] = v_cost;
+                        parents[v] = Some(u);
+                        push(&mut buckets, v, v_cost);
+                    }
+                }
+            }
+
+            buckets[b] = Vec::new();
+            b += 1;
+            if goal.is_some() {
+                break;
+            }
+        }
+
+        Some(ShortestPaths {
+            goal,
+            cost,
+            parents,
+        })
+    }
+}
+
+fn to_u32(value: usize) -> u32 {
+    u32::try_from(value).expect("CsrGraph supports fewer than u32::MAX nodes and edges.")
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use rand::{rngs::StdRng, Rng, SeedableRng};
+
+    #[test]
+    fn test_csr_graph_preserves_adjacency() {
+        let adjacency = vec![
+            vec![(1, 1.0), (3, 2.5)],
+            vec![],
+            vec![(0, 0.25)],
+            vec![(0, 2.5), (2, 3.0), (1, 1.5)],
+        ];
+        let graph = CsrGraph::from_adjacency(adjacency.clone());
+
+        assert_eq!(graph.num_nodes(), 4);
+        assert_eq!(graph.num_edges(), 6);
+        for (u, edges) in adjacency.iter().enumerate() {
+            assert_eq!(&graph.neighbours(u).collect::<Vec<_>>(), edges);
+        }
+    }
+
+    #[test]
+    fn test_empty_csr_graph() {
+        let graph = CsrGraph::from_adjacency(Vec::<Vec<(usize, f32)>>::new());
+        assert_eq!(graph.num_nodes(), 0);
+        assert_eq!(graph.num_edges(), 0);
+        assert_eq!(CsrGraph::default().num_nodes(), 0);
+    }
+
+    /// A plain O(n^2) Dijkstra returning the cost of every node from the sources.
+    fn dijkstra(graph: &CsrGraph, sources: &[(usize, f64)]) -> Vec<f64> {
+        let mut cost = vec![f64::INFINITY; graph.num_nodes()];
+        let mut done = vec![false; graph.num_nodes()];
+        for &(node, node_cost) in sources {
+            cost[node] = cost[node].min(node_cost);
+        }
+        while let Some(u) = (0..graph.num_nodes())
+            .filter(|&u| !done[u] && cost[u].is_finite())
+            .min_by(|&a, &b| cost[a].total_cmp(&cost[b]))
+        {
+            done[u] = true;
+            for (v, length) in graph.neighbours(u) {
+                cost[v] = cost[v].min(cost[u] + f64::from(length));
+            }
+        }
+        cost
+    }
+
+    /// Checks the search result against `dijkstra`, including that the parent chain of the goal
+    /// leads back to a source with the reported cost.
+    fn assert_matches_dijkstra(
+        graph: &CsrGraph,
+        sources: &[(usize, f64)],
+        is_goal: &[bool],
+        delta: f64,
+    ) {
+        let result = graph
+            .delta_stepping(sources, is_goal, delta, || false)
+            .unwrap();
+        let reference = dijkstra(graph, sources);
+        let best = (0..graph.num_nodes())
+            .filter(|&u| is_goal[u])
+            .map(|u| reference[u])
+            .fold(f64::INFINITY, f64::min);
+
+        let Some(goal) = result.goal else {
+            assert!(
+                best.is_infinite(),
+                "Missed a goal reachable at cost {best}."
+            );
+            return;
+        };
+        assert!(is_goal[goal]);
+        assert!(
+            (result.cost[goal] - best).abs() < 1e-9,
+            "Goal cost {} differs from the shortest {best}.",
+            result.cost[goal]
+        );
+
+        let mut node = goal;
+        let mut length = 0.0;
+        while let Some(parent) = result.parents[node] {
+            let edge = graph
+                .neighbours(parent)
+                .filter(|&(v, _)| v == node)
+                .map(|(_, w)| f64::from(w))
+                .fold(f64::INFINITY, f64::min);
+            length += edge;
+            node = parent;
+        }
+        let source_cost = sources
+            .iter()
+            .filter(|&&(s, _)| s == node)
+            .map(|&(_, c)| c)
+            .fold(f64::INFINITY, f64::min);
+        assert!((source_cost + length - result.cost[goal]).abs() < 1e-9);
+    }
+
+    fn undirected(num_nodes: usize, edges: &[(usize, usize, f32)]) -> CsrGraph {
+        let mut adjacency = vec![Vec::new(); num_nodes];
+        for &(u, v, w) in edges {
+            adjacency[u].push((v, w));
+            adjacency[v].push((u, w));
+        }
+        CsrGraph::from_adjacency(adjacency)
+    }
+
+    #[test]
+    fn test_delta_stepping_prefers_cheaper_multi_hop_path() {
+        // 0 -> 3 directly costs 1.0, but 0 -> 1 -> 2 -> 3 costs 0.3.
+        let graph = undirected(4, &[(0, 3, 1.0), (0, 1, 0.1), (1, 2, 0.1), (2, 3, 0.1)]);
+        let is_goal = [false, false, false, true];
+        let result = graph
+            .delta_stepping(&[(0, 0.0)], &is_goal, 0.5, || false)
+            .unwrap();
+        assert_eq!(result.goal, Some(3));
+        assert_eq!(result.parents[3], Some(2));
+        assert!((result.cost[3] - 0.3).abs() < 1e-6);
+        assert_matches_dijkstra(&graph, &[(0, 0.0)], &is_goal, 0.5);
+        assert_matches_dijkstra(&graph, &[(0, 0.0)], &is_goal, 0.01);
+    }
+
+    #[test]
+    fn test_delta_stepping_picks_cheapest_of_several_goals() {
+        let graph = undirected(5, &[(0, 1, 0.4), (1, 2, 0.4), (0, 3, 0.2), (3, 4, 0.7)]);
+        let is_goal = [false, false, true, false, true];
+        let result = graph
+            .delta_stepping(&[(0, 0.0)], &is_goal, 10.0, || false)
+            .unwrap();
+        assert_eq!(result.goal, Some(2));
+        assert_matches_dijkstra(&graph, &[(0, 0.0)], &is_goal, 0.25);
+    }
+
+    #[test]
+    fn test_delta_stepping_handles_ties_and_zero_length_edges() {
+        // Two equal routes to the goal, and a chain of zero-length edges.
+        let graph = undirected(
+            6,
+            &[
+                (0, 1, 0.5),
+                (0, 2, 0.5),
+                (1, 3, 0.5),
+                (2, 3, 0.5),
+                (3, 4, 0.0),
+                (4, 5, 0.0),
+            ],
+        );
+        let is_goal = [false, false, false, false, false, true];
+        let result = graph
+            .delta_stepping(&[(0, 0.0)], &is_goal, 0.25, || false)
+            .unwrap();
+        assert_eq!(result.goal, Some(5));
+        assert_eq!(result.cost[5], 1.0);
+        for delta in [0.1, 0.25, 1.0, f64::INFINITY] {
+            assert_matches_dijkstra(&graph, &[(0, 0.0)], &is_goal, delta);
+        }
+    }
+
+    #[test]
+    fn test_delta_stepping_reports_unreachable_goal() {
+        let graph = undirected(4, &[(0, 1, 0.3), (2, 3, 0.3)]);
+        let is_goal = [false, false, false, true];
+        let result = graph
+            .delta_stepping(&[(0, 0.0)], &is_goal, 0.2, || false)
+            .unwrap();
+        assert_eq!(result.goal, None);
+        assert!(result.cost[3].is_infinite());
+    }
+
+    #[test]
+    fn test_delta_stepping_uses_source_costs() {
+        // Node 1 is cheaper to reach from its source, even though node 0 is nearer the goal.
+        let graph = undirected(3, &[(0, 2, 0.5), (1, 2, 0.6)]);
+        let is_goal = [false, false, true];
+        let sources = [(0, 0.4), (1, 0.1)];
+        let result = graph
+            .delta_stepping(&sources, &is_goal, 0.3, || false)
+            .unwrap();
+        assert_eq!(result.parents[2], Some(1));
+        assert_matches_dijkstra(&graph, &sources, &is_goal, 0.3);
+    }
+
+    #[test]
+    fn test_delta_stepping_matches_dijkstra_on_random_graphs() {
+        let mut rng = StdRng::seed_from_u64(3);
+        for _ in 0..200 {
+            let num_nodes = rng.random_range(1..30);
+            let edges: Vec<(usize, usize, f32)> = (0..rng.random_range(0..80))
+                .map(|_| {
+                    let w = if rng.random_bool(0.1) {
+                        0.0
+                    } else {
+                        rng.random_range(0.0..1.0)
+                    };
+                    (
+                        rng.random_range(0..num_nodes),
+                        rng.random_range(0..num_nodes),
+                        w,
+                    )
+                })
+                .collect();
+            let graph = undirected(num_nodes, &edges);
+            let is_goal: Vec<bool> = (0..num_nodes).map(|_| rng.random_bool(0.2)).collect();
+            let sources: Vec<(usize, f64)> = (0..rng.random_range(1..4))
+                .map(|_| (rng.random_range(0..num_nodes), rng.random_range(0.0..0.5)))
+                .collect();
+            let delta = [0.05, 0.5, 2.0][rng.random_range(0..3)];
+            assert_matches_dijkstra(&graph, &sources, &is_goal, delta);
+        }
+    }
+
+    #[test]
+    fn test_delta_stepping_stops_when_asked() {
+        let graph = undirected(3, &[(0, 1, 0.5), (1, 2, 0.5)]);
+        let result = graph.delta_stepping(&[(0, 0.0)], &[false, false, true], 0.25, || true);
+        assert!(result.is_none());
+    }
+
+    #[test]
+    #[should_panic(expected = "outside the graph")]
+    fn test_csr_graph_rejects_dangling_edges() {
+        CsrGraph::from_adjacency(vec![vec![(1, 1.0)]]);
+    }
+}
@@ -0,0 +1,224 @@
+// Copyright (c) 2025 Junior Sundar
+//
+// SPDX-License-Identifier: BSD-3-Clause
+
+/// A node of the `KdTree`. Its point is stored in `KdTree::coords`, at the same index.
+#[derive(Clone)]
+struct KdNode {
+    /// The caller-provided identifier returned by queries.
+    item: usize,
+    /// The coordinate this node splits its children on.
+    axis: usize,
+    /// Indices of the children holding points below (`0`) and at or above (`1`) the split.
+    children: [Option<usize>; 2],
+}
+
+/// An incrementally built k-d tree over points in a Euclidean space.
+///
+/// Points are inserted one at a time and never rebalanced, which keeps insertion cheap and is
+/// well suited to sampling-based planners where points arrive in random order. Each point carries
+/// a `usize` item (typically an index into the planner's own node storage), and several points
+/// may share the same item.
+///
+/// # Examples
+///
+/// ```
+/// use oxmpl::datastructures::kd_tree::KdTree;
+///
+/// let mut tree = KdTree::new(2);
+/// tree.insert(&[0.0, 0.0], 0);
+/// tree.insert(&[1.0, 1.0], 1);
+/// tree.insert(&[5.0, 5.0], 2);
+///
+/// let mut found = Vec::new();
+/// tree.within(&[0.5, 0.5], 1.0, &mut found);
+/// found.sort();
+/// assert_eq!(found, vec![0, 1]);
+/// ```
+#[derive(Clone)]
+pub struct KdTree {
+    dimension: usize,
+    coords: Vec<f64>,
+    nodes: Vec<KdNode>,
+}
+
+impl KdTree {
+    /// Creates an empty tree for points with `dimension` coordinates.
+    ///
+    /// # Panics
+    /// Panics if `dimension` is zero.
+    pub fn new(dimension: usize) -> Self {
+        assert!(dimension > 0, "KdTree dimension must be greater than zero.");
+        Self {
+            dimension,
+            coords: Vec::new(),
+            nodes: Vec::new(),
+        }
+    }
+
+    /// Returns the number of coordinates of each point.
+    pub fn dimension(&self) -> usize {
+        self.dimension
+    }
+
+    /// Returns the number of points stored in the tree.
+    pub fn len(&self) -> usize {
+        self.nodes.len()
+    }
+
+    /// Returns `true` if the tree holds no points.
+    pub fn is_empty(&self) -> bool {
+        self.nodes.is_empty()
+    }
+
+    /// Removes all points from the tree.
+    pub fn clear(&mut self) {
+        self.coords.clear();
+        self.nodes.clear();
+    }
+
+    /// Inserts `point`, tagged with `item`.
+    ///
+    /// # Panics
+    /// Panics if `point` does not have `dimension` coordinates.
+    pub fn insert(&mut self, point: &[f64], item: usize) {
+        assert_eq!(
+            point.len(),
+            self.dimension,
+            "Point has incorrect dimension for this tree."
+        );
+
+        let new_idx = self.nodes.len();
+        let mut axis = 0;
+        if !self.nodes.is_empty() {
+            let mut current = 0;
+            loop {
+                let node = &self.nodes[current];
+                let split = self.coords[current * self.dimension + node.axis];
+                let side = usize::from(point[node.axis] >= split);
+                match node.children[side] {
+                    Some(child) => current = child,
+                    None => {
+                        axis = (node.axis + 1) % self.dimension;
+                        self.nodes[current].children[side] = Some(new_idx);
+                        break;
+                    }
+                }
+            }
+        }
+
+        self.coords.extend_from_slice(point);
+        self.nodes.push(KdNode {
+            item,
+            axis,
+            children: [None, None],
+        });
+    }
+
+    /// Appends to `out` the item of every point within Euclidean distance `radius` of `query`
+    /// (inclusive).
+    ///
+    /// Items are appended in no particular order, and an item is appended once per matching point,
+    /// so callers that insert several points per item should deduplicate.
+    ///
+    /// # Panics
+    /// Panics if `query` does not have `dimension` coordinates.
+    pub fn within(&self, query: &[f64], radius: f64, out: &mut Vec<usize>) {
+        assert_eq!(
+            query.len(),
+            self.dimension,
+            "Query has incorrect dimension for this tree."
+        );
+        if self.nodes.is_empty() || radius.is_nan() || radius < 0.0 {
+            return;
+        }
+
+        let radius_sq = radius * radius;
+        let mut stack = vec![0];
+        while let Some(idx) = stack.pop() {
+            let node = &self.nodes[idx];
+            let point = &self.coords[idx * self.dimension..(idx + 1) * self.dimension];
+
+            let dist_sq: f64 = point.iter().zip(query).map(|(p, q)| (p - q).powi(2)).sum();
+            if dist_sq <= radius_sq {
+                out.push(node.item);
+            }
+
+            // The far side of the split is at least `|diff|` away along this node's axis.
+            let diff = query[node.axis] - point[node.axis];
+            let near = usize::from(diff >= 0.0);
+            if let Some(child) = node.children[near] {
+                stack.push(child);
+            }
+            if diff.abs() <= radius {
+                if let Some(child) = node.children[1 - near] {
+                    stack.push(child);
+                }
+            }
+        }
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use rand::{rngs::StdRng, Rng, SeedableRng};
+
+    #[test]
+    fn test_kd_tree_within_matches_linear_scan() {
+        let mut rng = StdRng::seed_from_u64(7);
+        let dimension = 3;
+        let points: Vec<Vec<f64>> = (0..500)
+            .map(|_| {
+                (0..dimension)
+                    .map(|_| rng.random_range(-1.0..1.0))
+                    .collect()
+            })
+            .collect();
+
+        let mut tree = KdTree::new(dimension);
+        for (i, point) in points.iter().enumerate() {
+            tree.insert(point, i);
+        }
+        assert_eq!(tree.len(), points.len());
+
+        for _ in 0..50 {
+            let query: Vec<f64> = (0..dimension)
+                .map(|_| rng.random_range(-1.0..1.0))
+                .collect();
+            let radius = rng.random_range(0.0..0.6);
+
+            let mut found = Vec::new();
+            tree.within(&query, radius, &mut found);
+            found.sort_unstable();
+
+            let expected: Vec<usize> = points
+                .iter()
+                .enumerate()
+                .filter(|(_, p)| {
+                    p.iter()
+                        .zip(&query)
+                        .map(|(a, b)| (a - b).powi(2))
+                        .sum::<f64>()
+                        <= radius * radius
+                })
+                .map(|(i, _)| i)
+                .collect();
+            assert_eq!(found, expected);
+        }
+    }
+
+    #[test]
+    fn test_kd_tree_empty_and_negative_radius() {
+        let mut tree = KdTree::new(2);
+        let mut found = Vec::new();
+        tree.within(&[0.0, 0.0], 1.0, &mut found);
+        assert!(found.is_empty());
+
+        tree.insert(&[0.0, 0.0], 3);
+        tree.within(&[0.0, 0.0], -1.0, &mut found);
+        assert!(found.is_empty());
+        tree.within(&[0.0, 0.0], 0.0, &mut found);
+        assert_eq!(found, vec![3]);
+    }
+}
@@ -0,0 +1,7 @@
+// Copyright (c) 2025 Junior Sundar
+//
+// SPDX-License-Identifier: BSD-3-Clause
+
+pub mod csr_graph;
+pub mod kd_tree;
+pub mod nearest_neighbors_linear;
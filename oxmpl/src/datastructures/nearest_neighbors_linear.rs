@@ -0,0 +1,265 @@
+// Copyright (c) 2025 Junior Sundar
+//
+// SPDX-License-Identifier: BSD-3-Clause
+
+use std::ops::{Add, Mul, Sub};
+
+/// Number of points whose distances are accumulated together in `NearestNeighborsLinear::nearest`.
+const BLOCK_SIZE: usize = 64;
+
+/// A floating-point type that `NearestNeighborsLinear` can store coordinates as.
+///
+/// Implemented for `f64`, which keeps points exactly, and `f32`, which halves the memory the scan
+/// has to read and doubles the number of lanes per vector instruction, at the cost of rounding
+/// coordinates to about seven significant digits.
+pub trait Coordinate:
+    Copy + PartialOrd + Add<Output = Self> + Sub<Output = Self> + Mul<Output = Self>
+{
+    /// The additive identity.
+    const ZERO: Self;
+
+    /// Converts from `f64`, rounding if necessary.
+    fn from_f64(value: f64) -> Self;
+
+    /// Converts to `f64`.
+    fn to_f64(self) -> f64;
+}
+
+impl Coordinate for f64 {
+    const ZERO: Self = 0.0;
+
+    fn from_f64(value: f64) -> Self {
+        value
+    }
+
+    fn to_f64(self) -> f64 {
+        self
+    }
+}
+
+impl Coordinate for f32 {
+    const ZERO: Self = 0.0;
+
+    fn from_f64(value: f64) -> Self {
+        value as f32
+    }
+
+    fn to_f64(self) -> f64 {
+        f64::from(self)
+    }
+}
+
+/// A linear-scan nearest-neighbour structure over points in a Euclidean space.
+///
+/// Points are stored column-wise (one contiguous `Vec<f64>` per coordinate) rather than one
+/// allocation per point. The scan in `nearest` walks a block of points at a time, looping over
+/// coordinates on the outside and points on the inside, so the inner loop is a straight
+/// subtract-multiply-add over contiguous memory that the compiler vectorises.
+///
+/// Each point carries a `usize` item (typically an index into the planner's own node storage), and
+/// several points may share the same item.
+///
+/// Coordinates are stored as `T` (see `Coordinate`). With `f32`, `nearest` may return a point
+/// whose distance ties the true nearest one up to `f32` rounding, so callers that need the exact
+/// distance should recompute it from their own `f64` data.
+///
+/// # Examples
+///
+/// ```
+/// use oxmpl::datastructures::nearest_neighbors_linear::NearestNeighborsLinear;
+///
+/// let mut nn = NearestNeighborsLinear::<f64>::new(2);
+/// nn.insert(&[0.0, 0.0], 0);
+/// nn.insert(&[3.0, 4.0], 1);
+///
+/// assert_eq!(nn.nearest(&[2.0, 3.0]), Some((1, 2.0)));
+/// ```
+#[derive(Clone)]
+pub struct NearestNeighborsLinear<T: Coordinate = f64> {
+    columns: Vec<Vec<T>>,
+    items: Vec<usize>,
+}
+
+impl<T: Coordinate> NearestNeighborsLinear<T> {
+    /// Creates an empty structure for points with `dimension` coordinates.
+    ///
+    /// # Panics
+    /// Panics if `dimension` is zero.
+    pub fn new(dimension: usize) -> Self {
+        assert!(
+            dimension > 0,
+            "NearestNeighborsLinear dimension must be greater than zero."
+        );
+        Self {
+            columns: vec![Vec::new(); dimension],
+            items: Vec::new(),
+        }
+    }
+
+    /// Returns the number of coordinates of each point.
+    pub fn dimension(&self) -> usize {
+        self.columns.len()
+    }
+
+    /// Returns the number of points stored.
+    pub fn len(&self) -> usize {
+        self.items.len()
+    }
+
+    /// Returns `true` if no points are stored.
+    pub fn is_empty(&self) -> bool {
+        self.items.is_empty()
+    }
+
+    /// Removes all points.
+    pub fn clear(&mut self) {
+        for column in &mut self.columns {
+            column.clear();
+        }
+        self.items.clear();
+    }
+
+    /// Inserts `point`, tagged with `item`. The coordinates are converted to `T` once, here.
+    ///
+    /// # Panics
+    /// Panics if `point` does not have `dimension` coordinates.
+    pub fn insert(&mut self, point: &[f64], item: usize) {
+        assert_eq!(
+            point.len(),
+            self.columns.len(),
+            "Point has incorrect dimension for this structure."
+        );
+        for (column, &value) in self.columns.iter_mut().zip(point) {
+            column.push(T::from_f64(value));
+        }
+        self.items.push(item);
+    }
+
+    /// Inserts every point of `points`, all tagged with `item`.
+    ///
+    /// # Panics
+    /// Panics if any point does not have `dimension` coordinates.
+    pub fn insert_all(&mut self, points: &[Vec<f64>], item: usize) {
+        for point in points {
+            self.insert(point, item);
+        }
+    }
+
+    /// Finds the point closest to `query`.
+    ///
+    /// Returns the item of that point together with its *squared* Euclidean distance to `query`
+    /// (computed in `T`), or `None` if the structure is empty. Ties are resolved in favour of the earliest inserted
+    /// point.
+    ///
+    /// # Panics
+    /// Panics if `query` does not have `dimension` coordinates.
+    pub fn nearest(&self, query: &[f64]) -> Option<(usize, f64)> {
+        assert_eq!(
+            query.len(),
+            self.columns.len(),
+            "Query has incorrect dimension for this structure."
+        );
+
+        let query: Vec<T> = query.iter().map(|&q| T::from_f64(q)).collect();
+
+        let mut best: Option<(usize, T)> = None;
+        let mut dist_sq = [T::ZERO; BLOCK_SIZE];
+        for start in (0..self.len()).step_by(BLOCK_SIZE) {
+            let end = (start + BLOCK_SIZE).min(self.len());
+            let block = &mut dist_sq[..end - start];
+            block.fill(T::ZERO);
+
+            for (column, &q) in self.columns.iter().zip(&query) {
+                for (acc, &value) in block.iter_mut().zip(&column[start..end]) {
+                    let diff = value - q;
+                    *acc = *acc + diff * diff;
+                }
+            }
+
+            for (offset, &d) in block.iter().enumerate() {
+                if best.is_none_or(|(_, best_d)| d < best_d) {
+                    best = Some((self.items[start + offset], d));
+                }
+            }
+        }
+        best.map(|(item, d)| (item, d.to_f64()))
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use rand::{rngs::StdRng, Rng, SeedableRng};
+
+    #[test]
+    fn test_nearest_matches_naive_scan() {
+        let mut rng = StdRng::seed_from_u64(11);
+        let dimension = 3;
+        let points: Vec<Vec<f64>> = (0..300)
+            .map(|_| {
+                (0..dimension)
+                    .map(|_| rng.random_range(-1.0..1.0))
+                    .collect()
+            })
+            .collect();
+
+        let mut nn = NearestNeighborsLinear::<f64>::new(dimension);
+        assert_eq!(nn.nearest(&[0.0; 3]), None);
+        for (i, point) in points.iter().enumerate() {
+            nn.insert(point, i);
+        }
+
+        for _ in 0..50 {
+            let query: Vec<f64> = (0..dimension)
+                .map(|_| rng.random_range(-1.0..1.0))
+                .collect();
+            let expected = points
+                .iter()
+                .map(|p| {
+                    p.iter()
+                        .zip(&query)
+                        .map(|(a, b)| (a - b).powi(2))
+                        .sum::<f64>()
+                })
+                .enumerate()
+                .fold(
+                    (0, f64::INFINITY),
+                    |best, (i, d)| {
+                        if d < best.1 {
+                            (i, d)
+                        } else {
+                            best
+                        }
+                    },
+                );
+            let (item, dist_sq) = nn.nearest(&query).unwrap();
+            assert_eq!(item, expected.0);
+            assert!((dist_sq - expected.1).abs() < 1e-12);
+        }
+    }
+
+    #[test]
+    fn test_f32_nearest_is_within_rounding_of_exact() {
+        let mut rng = StdRng::seed_from_u64(13);
+        let points: Vec<Vec<f64>> = (0..1000)
+            .map(|_| vec![rng.random_range(0.0..10.0), rng.random_range(0.0..10.0)])
+            .collect();
+
+        let mut nn = NearestNeighborsLinear::<f32>::new(2);
+        for (i, point) in points.iter().enumerate() {
+            nn.insert(point, i);
+        }
+
+        let exact_dist =
+            |p: &[f64], q: &[f64]| ((p[0] - q[0]).powi(2) + (p[1] - q[1]).powi(2)).sqrt();
+        for _ in 0..100 {
+            let query = [rng.random_range(0.0..10.0), rng.random_range(0.0..10.0)];
+            let best = points
+                .iter()
+                .map(|p| exact_dist(p, &query))
+                .fold(f64::INFINITY, f64::min);
+            let (item, _) = nn.nearest(&query).unwrap();
+            assert!(exact_dist(&points[item], &query) - best < 1e-5);
+        }
+    }
+}
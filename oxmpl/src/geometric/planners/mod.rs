@@ -2,6 +2,8 @@
 //
 // SPDX-License-Identifier: BSD-3-Clause
 
+mod motion_validation;
+
 pub mod prm;
 pub mod rrt;
 pub mod rrt_connect;
@@ -0,0 +1,54 @@
+// Copyright (c) 2025 Junior Sundar
+//
+// SPDX-License-Identifier: BSD-3-Clause
+
+use std::collections::VecDeque;
+
+/// Returns the interpolation steps `1..=num_steps` of a motion in dichotomic order.
+///
+/// The end of the motion (`num_steps`) comes first, followed by the midpoint, then the midpoints
+/// of each half, and so on, as in OMPL's `DiscreteMotionValidator`. Every step appears exactly
+/// once. Checking states in this order finds an obstacle in the middle of a motion after
+/// `O(log n)` checks instead of `O(n)`.
+pub(super) fn dichotomic_steps(num_steps: usize) -> Vec<usize> {
+    let mut steps = Vec::with_capacity(num_steps);
+    if num_steps == 0 {
+        return steps;
+    }
+    steps.push(num_steps);
+
+    // Inclusive ranges of steps still to visit, refined breadth-first.
+    let mut intervals = VecDeque::from([(1, num_steps - 1)]);
+    while let Some((lo, hi)) = intervals.pop_front() {
+        if lo > hi {
+            continue;
+        }
+        let mid = lo + (hi - lo) / 2;
+        steps.push(mid);
+        if mid > lo {
+            intervals.push_back((lo, mid - 1));
+        }
+        intervals.push_back((mid + 1, hi));
+    }
+    steps
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_dichotomic_steps_visits_every_step_once() {
+        for num_steps in 0..100 {
+            let mut steps = dichotomic_steps(num_steps);
+            assert_eq!(steps.len(), num_steps);
+            steps.sort_unstable();
+            assert_eq!(steps, (1..=num_steps).collect::<Vec<_>>());
+        }
+    }
+
+    #[test]
+    fn test_dichotomic_steps_checks_end_then_midpoints() {
+        assert_eq!(dichotomic_steps(8), vec![8, 4, 2, 6, 1, 3, 5, 7]);
+    }
+}
@@ -2,10 +2,7 @@
 //
 // SPDX-License-Identifier: BSD-3-Clause
 
-use std::{
-    collections::{HashMap, VecDeque},
-    sync::Arc,
-};
+use std::sync::Arc;
 
 use crate::time::{Duration, Instant};
 
@@ -18,6 +15,13 @@ use crate::base::{
     state::State,
     validity::StateValidityChecker,
 };
+use crate::datastructures::{csr_graph::CsrGraph, kd_tree::KdTree};
+
+use super::motion_validation::dichotomic_steps;
+
+/// Number of states handed to `StateValidityChecker::is_valid_batch` at once, both when sampling
+/// milestones and when checking motions.
+const VALIDITY_BATCH_SIZE: usize = 64;
 
 /// Represents a node (or "milestone") in the probabilistic roadmap.
 #[derive(Clone)]
@@ -38,13 +42,16 @@ pub struct Node<S: State> {
 ///
 /// 1.  **Construction Phase**:
 ///     a. Sample a number of states randomly from the state space.
-///     b. For each valid sample, find all nearby nodes already in the roadmap.
+///     b. For each valid sample, find all nearby nodes already in the roadmap. If the state space
+///     provides a Euclidean embedding (see `StateSpace::embed`), candidates come from a k-d tree
+///     radius query; otherwise every node is checked.
 ///     c. If a valid, collision-free motion exists between the new sample and a neighbor, add an
 ///     edge connecting them in the roadmap.
+///     d. Once sampling stops, freeze the roadmap into a compressed sparse row graph for querying.
 /// 2.  **Query Phase**:
 ///     a. Connect the start and goal states to the roadmap.
-///     b. Use a graph search algorithm (in this case, Breadth-First Search) to find a path on the
-///     roadmap from the start to the goal.
+///     b. Use a graph search algorithm (in this case, delta-stepping over the edge lengths) to find
+///     the shortest path on the roadmap from the start to the goal.
 pub struct PRM<S: State, SP: StateSpace<StateType = S>, G: Goal<S>> {
     /// The time allocated for roadmap construction, in seconds.
     pub timeout: f64,
@@ -54,6 +61,10 @@ pub struct PRM<S: State, SP: StateSpace<StateType = S>, G: Goal<S>> {
     problem_def: Option<Arc<ProblemDefinition<S, SP, G>>>,
     validity_checker: Option<Arc<dyn StateValidityChecker<S>>>,
     roadmap: Vec<Node<S>>,
+    /// Spatial index over the embedded roadmap states, if the state space supports embedding.
+    index: Option<KdTree>,
+    /// The finished roadmap in CSR form, weighted by edge length. Searched by `solve`.
+    graph: Option<CsrGraph>,
 }
 
 impl<S, SP, G> PRM<S, SP, G>
@@ -74,6 +85,8 @@ where
             problem_def: None,
             validity_checker: None,
             roadmap: Vec::new(),
+            index: None,
+            graph: None,
         }
     }
 
@@ -114,13 +127,27 @@ where
 
         let mut rng = rand::rng();
         let start_time = Instant::now();
-        loop {
+        let mut samples = Vec::with_capacity(VALIDITY_BATCH_SIZE);
+        'sampling: loop {
             if start_time.elapsed().as_secs_f64() > self.timeout {
                 break;
             }
 
-            let q_rand = pd.space.sample_uniform(&mut rng).unwrap();
-            if vc.is_valid(&q_rand) {
+            // Sample and check a whole batch of states, then connect the valid ones one by one.
+            samples.clear();
+            for _ in 0..VALIDITY_BATCH_SIZE {
+                samples.push(pd.space.sample_uniform(&mut rng).unwrap());
+            }
+            let validity = vc.is_valid_batch(&samples);
+
+            for (q_rand, is_valid) in samples.drain(..).zip(validity) {
+                if start_time.elapsed().as_secs_f64() > self.timeout {
+                    break 'sampling;
+                }
+                if !is_valid {
+                    continue;
+                }
+
                 let mut new_node = Node {
                     state: q_rand.clone(),
                     edges: Vec::new(),
@@ -128,10 +155,8 @@ where
 
                 let mut to_update: Vec<usize> = Vec::new();
 
-                for i in 0..self.roadmap.len() {
-                    let other_state = self.roadmap[i].state.clone();
-                    let dist = pd.space.distance(&q_rand, &other_state);
-                    if dist < self.connection_radius && self.check_motion(&q_rand, &other_state) {
+                for i in self.find_neighbours(&q_rand) {
+                    if self.check_motion(&q_rand, &self.roadmap[i].state) {
                         new_node.edges.push(i);
                         to_update.push(i);
                     }
@@ -140,11 +165,21 @@ where
                 let new_node_idx = self.roadmap.len();
                 self.roadmap.push(new_node);
 
+                if let Some(points) = pd.space.embed(&q_rand) {
+                    let index = self
+                        .index
+                        .get_or_insert_with(|| KdTree::new(points[0].len()));
+                    for point in &points {
+                        index.insert(point, new_node_idx);
+                    }
+                }
+
                 for i in to_update {
                     self.roadmap[i].edges.push(new_node_idx);
                 }
             }
         }
+        self.freeze_roadmap();
         println!(
             "PRM: Roadmap constructed with {} milestones.",
             self.roadmap.len()
@@ -153,11 +188,55 @@ where
         Ok(())
     }
 
+    /// Flattens the adjacency lists of `roadmap` into `graph`, weighting each edge by the distance
+    /// between its endpoints.
+    fn freeze_roadmap(&mut self) {
+        let Some(pd) = &self.problem_def else {
+            return;
+        };
+        let roadmap = &self.roadmap;
+        self.graph = Some(CsrGraph::from_adjacency(roadmap.iter().map(|node| {
+            node.edges.iter().map(|&j| {
+                let length = pd.space.distance(&node.state, &roadmap[j].state);
+                (j, length as f32)
+            })
+        })));
+    }
+
+    /// Returns the indices, in increasing order, of all roadmap nodes strictly within
+    /// `connection_radius` of `state`.
+    ///
+    /// If the roadmap is indexed, the k-d tree supplies a superset of the neighbours. Otherwise
+    /// every node is a candidate. Candidates are confirmed by comparing `distance_proxy` against
+    /// the radius converted once with `StateSpace::proxy_threshold`.
+    fn find_neighbours(&self, state: &S) -> Vec<usize> {
+        let Some(pd) = &self.problem_def else {
+            return Vec::new();
+        };
+
+        let mut candidates = Vec::new();
+        match (&self.index, pd.space.embed(state)) {
+            (Some(index), Some(points)) => {
+                let radius = pd.space.embedded_radius(self.connection_radius);
+                index.within(&points[0], radius, &mut candidates);
+                candidates.sort_unstable();
+                candidates.dedup();
+            }
+            _ => candidates.extend(0..self.roadmap.len()),
+        }
+
+        let threshold = pd.space.proxy_threshold(self.connection_radius);
+        candidates.retain(|&i| pd.space.distance_proxy(state, &self.roadmap[i].state) < threshold);
+        candidates
+    }
+
     /// An internal helper function to check if the motion between two states is valid.
     ///
     /// It works by discretizing the straight-line path between `from` and `to` into small steps
-    /// and calling the `StateValidityChecker` on each intermediate state. If any intermediate
-    /// state is invalid, the entire motion is considered invalid.
+    /// and calling the `StateValidityChecker` on the intermediate states, up to
+    /// `VALIDITY_BATCH_SIZE` of them at a time in the dichotomic order given by
+    /// `dichotomic_steps`. If any intermediate state is invalid, the entire motion is considered
+    /// invalid.
     fn check_motion(&self, from: &S, to: &S) -> bool {
         // We need access to the space and checker from our stored setup info.
         if let (Some(pd), Some(vc)) = (&self.problem_def, &self.validity_checker) {
@@ -171,12 +250,18 @@ where
                 return vc.is_valid(to);
             }
 
-            let mut interpolated_state = from.clone();
-            for i in 1..=num_steps {
+            let mut batch = Vec::with_capacity(num_steps.min(VALIDITY_BATCH_SIZE));
+            for (checked, i) in dichotomic_steps(num_steps).into_iter().enumerate() {
                 let t = i as f64 / num_steps as f64;
+                let mut interpolated_state = from.clone();
                 space.interpolate(from, to, t, &mut interpolated_state);
-                if !vc.is_valid(&interpolated_state) {
-                    return false;
+                batch.push(interpolated_state);
+
+                if batch.len() == VALIDITY_BATCH_SIZE || checked + 1 == num_steps {
+                    if !vc.is_valid_batch(&batch).into_iter().all(|valid| valid) {
+                        return false;
+                    }
+                    batch.clear();
                 }
             }
 
@@ -189,14 +274,14 @@ where
     fn reconstruct_path(
         &self,
         start_state: &S,
-        parent_map: HashMap<usize, Option<usize>>,
+        parents: &[Option<usize>],
         goal_idx: usize,
     ) -> Path<S> {
         let mut path = vec![start_state.clone()];
         let mut current = goal_idx;
         let mut states = Vec::new();
 
-        while let Some(parent) = parent_map[&current] {
+        while let Some(parent) = parents[current] {
             states.push(self.roadmap[current].state.clone());
             current = parent;
         }
@@ -222,6 +307,8 @@ where
         self.problem_def = Some(problem_def);
         self.validity_checker = Some(validity_checker);
         self.roadmap.clear();
+        self.index = None;
+        self.graph = None;
     }
 
     fn solve(&mut self, timeout: Duration) -> Result<Path<S>, PlanningError> {
@@ -236,9 +323,10 @@ where
             .ok_or(PlanningError::PlannerUninitialised)?;
         let goal = &pd.goal;
 
-        if self.roadmap.is_empty() {
-            return Err(PlanningError::UnsampledStateSpace);
-        }
+        let graph = match &self.graph {
+            Some(graph) if graph.num_nodes() > 0 => graph,
+            _ => return Err(PlanningError::UnsampledStateSpace),
+        };
 
         let start_state = &pd.start_states[0];
         if !vc.is_valid(start_state) {
@@ -246,63 +334,153 @@ where
         }
 
         // Connect start state to the roadmap
-        let mut start_connections = Vec::new();
-        for i in 0..self.roadmap.len() {
-            if pd.space.distance(start_state, &self.roadmap[i].state) < self.connection_radius
-                && self.check_motion(start_state, &self.roadmap[i].state)
-            {
-                start_connections.push(i);
-            }
-        }
+        let mut start_connections = self.find_neighbours(start_state);
+        start_connections.retain(|&i| self.check_motion(start_state, &self.roadmap[i].state));
 
         // Find goal nodes in the roadmap
-        let mut goal_indices = Vec::new();
-        for i in 0..self.roadmap.len() {
-            if goal.is_satisfied(&self.roadmap[i].state) {
-                goal_indices.push(i);
-            }
-        }
+        let is_goal: Vec<bool> = self
+            .roadmap
+            .iter()
+            .map(|node| goal.is_satisfied(&node.state))
+            .collect();
 
-        if start_connections.is_empty() || goal_indices.is_empty() {
+        if start_connections.is_empty() || !is_goal.contains(&true) {
             return Err(PlanningError::NoSolutionFound);
         }
 
-        // Graph Search (Breadth-First Search)
-        let mut queue: VecDeque<usize> = start_connections.clone().into_iter().collect();
-        let mut parent_map: HashMap<usize, Option<usize>> = HashMap::new();
-        let mut visited = vec![false; self.roadmap.len()];
+        // Graph Search (sequential delta-stepping, see `CsrGraph::delta_stepping`). No roadmap
+        // edge is longer than `connection_radius`, so with this bucket width an edge spans at most
+        // two buckets.
+        let delta = if self.connection_radius > 0.0 && self.connection_radius.is_finite() {
+            0.5 * self.connection_radius
+        } else {
+            f64::INFINITY
+        };
+        let sources: Vec<(usize, f64)> = start_connections
+            .iter()
+            .map(|&idx| {
+                (
+                    idx,
+                    pd.space.distance(start_state, &self.roadmap[idx].state),
+                )
+            })
+            .collect();
+
+        let start_time = Instant::now();
+        let paths = graph
+            .delta_stepping(&sources, &is_goal, delta, || start_time.elapsed() > timeout)
+            .ok_or(PlanningError::Timeout)?;
+
+        // If no goal was reached, no path exists
+        let goal_node_idx = paths.goal.ok_or(PlanningError::NoSolutionFound)?;
+
+        Ok(self.reconstruct_path(start_state, &paths.parents, goal_node_idx))
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::base::{error::StateSamplingError, space::SO3StateSpace, state::SO3State};
+    use rand::{rngs::StdRng, Rng, SeedableRng};
+    use std::sync::atomic::{AtomicUsize, Ordering};
+
+    /// Forwards to `SO3StateSpace`, counting every call that evaluates `acos` or `cos`.
+    struct CountingSO3Space {
+        inner: SO3StateSpace,
+        trig_calls: AtomicUsize,
+    }
+
+    impl CountingSO3Space {
+        fn count(&self) {
+            self.trig_calls.fetch_add(1, Ordering::Relaxed);
+        }
+    }
+
+    impl StateSpace for CountingSO3Space {
+        type StateType = SO3State;
 
-        for idx in &start_connections {
-            queue.push_back(*idx);
-            parent_map.insert(*idx, None);
-            visited[*idx] = true;
+        fn distance(&self, state1: &SO3State, state2: &SO3State) -> f64 {
+            self.count();
+            self.inner.distance(state1, state2)
         }
 
-        let mut goal_reached = None;
+        fn distance_proxy(&self, state1: &SO3State, state2: &SO3State) -> f64 {
+            self.inner.distance_proxy(state1, state2)
+        }
 
-        let start_time = Instant::now();
-        while let Some(current_idx) = queue.pop_front() {
-            if start_time.elapsed() > timeout {
-                return Err(PlanningError::Timeout);
-            }
+        fn proxy_threshold(&self, threshold: f64) -> f64 {
+            self.count();
+            self.inner.proxy_threshold(threshold)
+        }
 
-            if goal_indices.contains(&current_idx) {
-                goal_reached = Some(current_idx);
-                break;
-            }
+        fn interpolate(&self, from: &SO3State, to: &SO3State, t: f64, out_state: &mut SO3State) {
+            self.inner.interpolate(from, to, t, out_state)
+        }
 
-            for &neighbor_idx in &self.roadmap[current_idx].edges {
-                if !visited[neighbor_idx] {
-                    visited[neighbor_idx] = true;
-                    parent_map.insert(neighbor_idx, Some(current_idx));
-                    queue.push_back(neighbor_idx);
-                }
-            }
+        fn enforce_bounds(&self, state: &mut SO3State) {
+            self.inner.enforce_bounds(state)
         }
 
-        // If no goal was reached, no path exists
-        let goal_node_idx = goal_reached.ok_or(PlanningError::NoSolutionFound)?;
+        fn satisfies_bounds(&self, state: &SO3State) -> bool {
+            self.inner.satisfies_bounds(state)
+        }
 
-        Ok(self.reconstruct_path(start_state, parent_map, goal_node_idx))
+        fn sample_uniform(&self, rng: &mut impl Rng) -> Result<SO3State, StateSamplingError> {
+            self.inner.sample_uniform(rng)
+        }
+
+        fn get_longest_valid_segment_length(&self) -> f64 {
+            self.inner.get_longest_valid_segment_length()
+        }
+    }
+
+    struct NoGoal;
+
+    impl Goal<SO3State> for NoGoal {
+        fn is_satisfied(&self, _state: &SO3State) -> bool {
+            false
+        }
+    }
+
+    #[test]
+    fn test_find_neighbours_converts_radius_once() {
+        let mut rng = StdRng::seed_from_u64(11);
+        let space = CountingSO3Space {
+            inner: SO3StateSpace::new(None).unwrap(),
+            trig_calls: AtomicUsize::new(0),
+        };
+        let states: Vec<SO3State> = (0..300)
+            .map(|_| space.sample_uniform(&mut rng).unwrap())
+            .collect();
+        let query = space.sample_uniform(&mut rng).unwrap();
+
+        let mut prm = PRM::new(1.0, 0.6);
+        prm.roadmap = states
+            .iter()
+            .map(|state| Node {
+                state: state.clone(),
+                edges: Vec::new(),
+            })
+            .collect();
+        prm.problem_def = Some(Arc::new(ProblemDefinition {
+            space: Arc::new(space),
+            start_states: Vec::new(),
+            goal: Arc::new(NoGoal),
+        }));
+
+        let neighbours = prm.find_neighbours(&query);
+
+        let pd = prm.problem_def.as_ref().unwrap();
+        assert_eq!(
+            pd.space.trig_calls.load(Ordering::Relaxed),
+            1,
+            "Only the radius conversion may use transcendental functions."
+        );
+        let expected: Vec<usize> = (0..states.len())
+            .filter(|&i| pd.space.inner.distance(&query, &states[i]) < 0.6)
+            .collect();
+        assert!(!expected.is_empty());
+        assert_eq!(neighbours, expected);
     }
 }
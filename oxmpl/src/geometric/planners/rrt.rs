@@ -17,6 +17,9 @@ use crate::base::{
     state::State,
     validity::StateValidityChecker,
 };
+use crate::datastructures::nearest_neighbors_linear::NearestNeighborsLinear;
+
+use super::motion_validation::dichotomic_steps;
 
 // A helper struct to build the tree. Each node stores its state and the index of its parent in the
 // tree vector.
@@ -59,6 +62,8 @@ pub struct RRT<S: State, SP: StateSpace<StateType = S>, G: Goal<S>> {
     problem_def: Option<Arc<ProblemDefinition<S, SP, G>>>,
     validity_checker: Option<Arc<dyn StateValidityChecker<S>>>,
     tree: Vec<Node<S>>,
+    /// Embedded tree states for nearest-neighbour queries, if the state space supports embedding.
+    nn: Option<NearestNeighborsLinear<f32>>,
 }
 
 impl<S, SP, G> RRT<S, SP, G>
@@ -79,14 +84,16 @@ where
             problem_def: None,
             validity_checker: None,
             tree: Vec::new(),
+            nn: None,
         }
     }
 
     /// An internal helper function to check if the motion between two states is valid.
     ///
     /// It works by discretizing the straight-line path between `from` and `to` into small steps
-    /// and calling the `StateValidityChecker` on each intermediate state. If any intermediate
-    /// state is invalid, the entire motion is considered invalid.
+    /// and calling the `StateValidityChecker` on each intermediate state, in the dichotomic order
+    /// given by `dichotomic_steps`. If any intermediate state is invalid, the entire motion is
+    /// considered invalid.
     fn check_motion(&self, from: &S, to: &S) -> bool {
         // We need access to the space and checker from our stored setup info.
         if let (Some(pd), Some(vc)) = (&self.problem_def, &self.validity_checker) {
@@ -101,7 +108,7 @@ where
             }
 
             let mut interpolated_state = from.clone();
-            for i in 1..=num_steps {
+            for i in dichotomic_steps(num_steps) {
                 let t = i as f64 / num_steps as f64;
                 space.interpolate(from, to, t, &mut interpolated_state);
                 if !vc.is_valid(&interpolated_state) {
@@ -115,6 +122,32 @@ where
         }
     }
 
+    /// Returns the index of the tree node nearest to `state`.
+    ///
+    /// Uses the embedded nearest-neighbour scan if available. Otherwise only the ordering of
+    /// distances matters, so every node is compared with the cheaper distance proxy.
+    fn nearest(&self, state: &S) -> usize {
+        let Some(pd) = &self.problem_def else {
+            return 0;
+        };
+        if let (Some(nn), Some(points)) = (&self.nn, pd.space.embed(state)) {
+            if let Some((idx, _)) = nn.nearest(&points[0]) {
+                return idx;
+            }
+        }
+
+        let mut nearest_node_index = 0;
+        let mut min_proxy = pd.space.distance_proxy(&self.tree[0].state, state);
+        for i in 1..self.tree.len() {
+            let proxy = pd.space.distance_proxy(&self.tree[i].state, state);
+            if proxy < min_proxy {
+                min_proxy = proxy;
+                nearest_node_index = i;
+            }
+        }
+        nearest_node_index
+    }
+
     fn reconstruct_path(&self, start_node_idx: usize) -> Path<S> {
         let mut path_states = Vec::new();
         let mut current_index = Some(start_node_idx);
@@ -145,9 +178,16 @@ where
         self.problem_def = Some(problem_def);
         self.validity_checker = Some(validity_checker);
         self.tree.clear();
+        self.nn = None;
 
         // Initialise the tree with the start state.
-        let start_state = self.problem_def.as_ref().unwrap().start_states[0].clone();
+        let pd = self.problem_def.as_ref().unwrap();
+        let start_state = pd.start_states[0].clone();
+        if let Some(points) = pd.space.embed(&start_state) {
+            let mut nn = NearestNeighborsLinear::new(points[0].len());
+            nn.insert_all(&points, 0);
+            self.nn = Some(nn);
+        }
         let start_node = Node {
             state: start_state,
             parent_index: None,
@@ -183,18 +223,10 @@ where
                 pd.space.sample_uniform(&mut rng).unwrap()
             };
 
-            // 3. Find the nearest node in the tree (q_near)
-            let mut nearest_node_index = 0;
-            let mut min_dist = pd.space.distance(&self.tree[0].state, &q_rand);
-
-            for i in 1..self.tree.len() {
-                let dist = pd.space.distance(&self.tree[i].state, &q_rand);
-                if dist < min_dist {
-                    min_dist = dist;
-                    nearest_node_index = i;
-                }
-            }
+            // 3. Find the nearest node in the tree (q_near).
+            let nearest_node_index = self.nearest(&q_rand);
             let q_near = &self.tree[nearest_node_index].state;
+            let min_dist = pd.space.distance(q_near, &q_rand);
 
             // 4. Steer from q_near towards q_rand to get q_new
             let mut q_new = q_near.clone();
@@ -214,6 +246,9 @@ where
                     state: q_new.clone(),
                     parent_index: Some(nearest_node_index),
                 };
+                if let (Some(nn), Some(points)) = (&mut self.nn, pd.space.embed(&q_new)) {
+                    nn.insert_all(&points, self.tree.len());
+                }
                 self.tree.push(new_node);
 
                 // 7. Check if the new node satisfies the goal
@@ -17,6 +17,9 @@ use crate::base::{
     state::State,
     validity::StateValidityChecker,
 };
+use crate::datastructures::nearest_neighbors_linear::NearestNeighborsLinear;
+
+use super::motion_validation::dichotomic_steps;
 
 // A helper struct to build the tree. Each node stores its state and the index of its parent in the
 #[derive(Clone)]
@@ -70,6 +73,10 @@ pub struct RRTConnect<S: State, SP: StateSpace<StateType = S>, G: Goal<S>> {
     validity_checker: Option<Arc<dyn StateValidityChecker<S>>>,
     start_tree: Vec<Node<S>>,
     goal_tree: Vec<Node<S>>,
+    /// Embedded states of each tree for nearest-neighbour queries, if the state space supports
+    /// embedding.
+    start_nn: Option<NearestNeighborsLinear<f32>>,
+    goal_nn: Option<NearestNeighborsLinear<f32>>,
 }
 
 impl<S, SP, G> RRTConnect<S, SP, G>
@@ -91,6 +98,8 @@ where
             validity_checker: None,
             start_tree: Vec::new(),
             goal_tree: Vec::new(),
+            start_nn: None,
+            goal_nn: None,
         }
     }
 
@@ -105,11 +114,21 @@ where
         Path(path_states)
     }
 
+    /// Builds the nearest-neighbour structure for a tree holding only `root`, if the state space
+    /// supports embedding.
+    fn root_nn(root: &S, pd: &ProblemDefinition<S, SP, G>) -> Option<NearestNeighborsLinear<f32>> {
+        let points = pd.space.embed(root)?;
+        let mut nn = NearestNeighborsLinear::new(points[0].len());
+        nn.insert_all(&points, 0);
+        Some(nn)
+    }
+
     /// Helper function to extend a tree towards a target state.
     ///
-    /// This function finds the node in the `tree` nearest to `q_target`. It then creates a new state
-    /// `q_new` by moving from the nearest node towards `q_target` by a distance of at most
-    /// `max_distance`. If the motion to `q_new` is valid, it adds `q_new` to the tree.
+    /// This function finds the node in the `tree` nearest to `q_target`, using `nn` if available.
+    /// It then creates a new state `q_new` by moving from the nearest node towards `q_target` by a
+    /// distance of at most `max_distance`. If the motion to `q_new` is valid, it adds `q_new` to
+    /// the tree and to `nn`.
     ///
     /// Returns a tuple `(ExtendResult, usize)` on success, where `usize` is the index of the new node.
     /// Returns `None` if the motion was invalid.
@@ -120,22 +139,32 @@ where
     /// > compiler was complaining.
     fn extend(
         tree: &mut Vec<Node<S>>,
+        nn: &mut Option<NearestNeighborsLinear<f32>>,
         q_target: &S,
         pd: &ProblemDefinition<S, SP, G>,
         vc: &Arc<dyn StateValidityChecker<S>>,
         max_distance: f64,
     ) -> Option<(ExtendResult, usize)> {
-        let mut nearest_node_index = 0;
-        let mut min_dist = pd.space.distance(&tree[0].state, q_target);
-        for (i, node) in tree.iter().enumerate().skip(1) {
-            let dist = pd.space.distance(&node.state, q_target);
-            if dist < min_dist {
-                min_dist = dist;
-                nearest_node_index = i;
+        let embedded_nearest = match (nn.as_ref(), pd.space.embed(q_target)) {
+            (Some(nn), Some(points)) => nn.nearest(&points[0]).map(|(idx, _)| idx),
+            _ => None,
+        };
+        let nearest_node_index = embedded_nearest.unwrap_or_else(|| {
+            // Only the ordering matters here, so compare with the cheaper distance proxy.
+            let mut nearest_node_index = 0;
+            let mut min_proxy = pd.space.distance_proxy(&tree[0].state, q_target);
+            for (i, node) in tree.iter().enumerate().skip(1) {
+                let proxy = pd.space.distance_proxy(&node.state, q_target);
+                if proxy < min_proxy {
+                    min_proxy = proxy;
+                    nearest_node_index = i;
+                }
             }
-        }
+            nearest_node_index
+        });
 
         let q_near = tree[nearest_node_index].state.clone();
+        let min_dist = pd.space.distance(&q_near, q_target);
         let mut q_new = q_near.clone();
         let result = if min_dist > max_distance {
             let t = max_distance / min_dist;
@@ -148,6 +177,9 @@ where
 
         if Self::check_motion(&q_near, &q_new, pd, vc) {
             let new_node_idx = tree.len();
+            if let (Some(nn), Some(points)) = (nn.as_mut(), pd.space.embed(&q_new)) {
+                nn.insert_all(&points, new_node_idx);
+            }
             tree.push(Node {
                 state: q_new,
                 parent_index: Some(nearest_node_index),
@@ -161,8 +193,9 @@ where
     /// An internal helper function to check if the motion between two states is valid.
     ///
     /// It works by discretizing the straight-line path between `from` and `to` into small steps and
-    /// calling the `StateValidityChecker` on each intermediate state. If any intermediate state is
-    /// invalid, the entire motion is considered invalid.
+    /// calling the `StateValidityChecker` on each intermediate state, in the dichotomic order given
+    /// by `dichotomic_steps`. If any intermediate state is invalid, the entire motion is considered
+    /// invalid.
     fn check_motion(
         from: &S,
         to: &S,
@@ -178,7 +211,7 @@ where
         }
 
         let mut interpolated_state = from.clone();
-        for i in 1..=num_steps {
+        for i in dichotomic_steps(num_steps) {
             let t = i as f64 / num_steps as f64;
             space.interpolate(from, to, t, &mut interpolated_state);
             if !vc.is_valid(&interpolated_state) {
@@ -213,6 +246,7 @@ where
             state: start_state,
             parent_index: None,
         };
+        self.start_nn = Self::root_nn(&start_node.state, pd);
         self.start_tree.push(start_node);
 
         let mut rng = rand::rng();
@@ -221,6 +255,7 @@ where
             state: goal_state,
             parent_index: None,
         };
+        self.goal_nn = Self::root_nn(&goal_node.state, pd);
         self.goal_tree.push(goal_node);
     }
 
@@ -246,11 +281,23 @@ where
 
             // 2. Determine which tree to grow (tree_a) and which to connect to (tree_b). This
             //    balances the trees, which is more efficient.
-            let (tree_a, tree_b, is_growing_start_tree) =
+            let (tree_a, nn_a, tree_b, nn_b, is_growing_start_tree) =
                 if self.start_tree.len() <= self.goal_tree.len() {
-                    (&mut self.start_tree, &mut self.goal_tree, true)
+                    (
+                        &mut self.start_tree,
+                        &mut self.start_nn,
+                        &mut self.goal_tree,
+                        &mut self.goal_nn,
+                        true,
+                    )
                 } else {
-                    (&mut self.goal_tree, &mut self.start_tree, false)
+                    (
+                        &mut self.goal_tree,
+                        &mut self.goal_nn,
+                        &mut self.start_tree,
+                        &mut self.start_nn,
+                        false,
+                    )
                 };
 
             // 3. Sample a random target state `q_rand`, with goal biasing.
@@ -263,7 +310,7 @@ where
 
             // 4. Try to extend tree_a towards q_rand.
             if let Some((_extend_result, new_node_idx_a)) =
-                Self::extend(tree_a, &q_rand, pd, vc, self.max_distance)
+                Self::extend(tree_a, nn_a, &q_rand, pd, vc, self.max_distance)
             {
                 let q_new = &tree_a[new_node_idx_a].state;
 
@@ -275,7 +322,7 @@ where
 
                 // 5. Try to connect tree_b to the new state `q_new`.
                 if let Some((connect_result, new_node_idx_b)) =
-                    Self::extend(tree_b, q_new, pd, vc, self.max_distance)
+                    Self::extend(tree_b, nn_b, q_new, pd, vc, self.max_distance)
                 {
                     // 6. If the connection reached q_new, a solution is found.
                     if connect_result == ExtendResult::Reached {
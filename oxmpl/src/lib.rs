@@ -1,3 +1,4 @@
 pub mod base;
+pub mod datastructures;
 pub mod geometric;
 pub mod time;